@@ -30,44 +30,44 @@ English Steps:
 """
 
 import asyncio
-import re
-from playwright.async_api import Playwright, async_playwright, expect
+from playwright.async_api import BrowserContext, expect
 
+import _harness
 
-async def run(playwright: Playwright) -> None:
-    browser = await playwright.chromium.launch(headless=False, slow_mo=500)  # 500ms delay between actions for visibility
-    context = await browser.new_context(viewport={"width":1280,"height":720})
+
+async def run(context: BrowserContext) -> None:
     page = await context.new_page()
+    # Bind locators once and reuse — avoids re-parsing the selector per call
+    username = page.locator("[data-test=\"username\"]")
+    password = page.locator("[data-test=\"password\"]")
+    login_button = page.locator("[data-test=\"login-button\"]")
+    # CSS id lookup instead of an O(DOM) accessibility-tree query
+    menu_button = page.locator("#react-burger-menu-btn")
+    logout_link = page.locator("[data-test=\"logout-sidebar-link\"]")
     await page.goto("https://www.saucedemo.com/")
-    await page.locator("[data-test=\"username\"]").click()
-    await page.locator("[data-test=\"username\"]").fill("standard_user")
-    await page.locator("[data-test=\"password\"]").click()
-    await page.locator("[data-test=\"password\"]").fill("secret_sauce")
-    await page.locator("[data-test=\"login-button\"]").click()
+    await username.fill("standard_user")
+    await password.fill("secret_sauce")
+    await login_button.click()
     await page.locator("[data-test=\"add-to-cart-sauce-labs-backpack\"]").click()
     await page.locator("[data-test=\"shopping-cart-link\"]").click()
     await page.locator("[data-test=\"checkout\"]").click()
-    await page.locator("[data-test=\"firstName\"]").click()
     await page.locator("[data-test=\"firstName\"]").fill("Test")
-    await page.locator("[data-test=\"lastName\"]").click()
     await page.locator("[data-test=\"lastName\"]").fill("User")
-    await page.locator("[data-test=\"postalCode\"]").click()
     await page.locator("[data-test=\"postalCode\"]").fill("12345")
     await page.locator("[data-test=\"continue\"]").click()
     await page.locator("[data-test=\"finish\"]").click()
     await expect(page.locator("[data-test=\"pony-express\"]")).to_be_visible()
     await expect(page.locator("[data-test=\"complete-header\"]")).to_be_visible()
-    await page.get_by_role("button", name="Open Menu").click()
-    await page.locator("[data-test=\"logout-sidebar-link\"]").click()
-
-    # ---------------------
-    await context.close()
-    await browser.close()
+    await menu_button.click()
+    await logout_link.click()
 
 
 async def main() -> None:
-    async with async_playwright() as playwright:
-        await run(playwright)
+    try:
+        await _harness.with_context(run)
+    finally:
+        await _harness.shutdown()
 
 
-asyncio.run(main())
+if __name__ == "__main__":
+    asyncio.run(main())
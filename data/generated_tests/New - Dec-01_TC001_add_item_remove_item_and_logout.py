@@ -5,136 +5,93 @@ Suite: New - Dec-01
 Generated: 2025-12-01 20:10:47
 """
 import asyncio
-from playwright.async_api import async_playwright, expect
+from playwright.async_api import expect
 import os
 
-async def test_tc001():
+import _harness
+
+async def test_tc001(context):
     """
     Add item, remove item, and logout
     
     Test Steps:
     1. Add 'Sauce Labs Backpack' to cart using selector: #add-to-cart-sauce-labs-backpack\n    2. Navigate to shopping cart using selector: .shopping_cart_link\n    3. Remove 'Sauce Labs Backpack' from cart using selector: #remove-sauce-labs-backpack\n    4. Open side menu using selector: #react-burger-menu-btn\n    5. Click 'Logout' using selector: #logout_sidebar_link\n    """
     
-    async with async_playwright() as p:
-        # Launch with slow_mo for visibility and Chrome flags to suppress alerts
-        browser = await p.chromium.launch(
-            headless=False,
-            slow_mo=1000,  # 1 second delay per action
-            args=[
-                "--start-maximized",
-                "--disable-save-password-bubble",
-                "--disable-password-manager",
-                "--disable-infobars",
-                "--no-default-browser-check"
-            ]
-        )
-        # Create context with viewport=None to respect maximized window
-        context = await browser.new_context(no_viewport=True)
-        page = await context.new_page()
-        
-        try:
-            print(f"Starting test: Add item, remove item, and logout")
-            test_id = "TC001"
+    page = await context.new_page()
+    _auth_loaded = _harness.auth_state() is not None
+
+    try:
+        print(f"Starting test: Add item, remove item, and logout")
+        test_id = "TC001"
 
-            
-            # Load credentials from secure config file
-            import json
-            from pathlib import Path
-            config_file = Path(__file__).parent / "New - Dec-01_metadata.json"
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    test_url = config.get('url', '')
-                    test_username = config.get('username', '')
-                    test_password = config.get('password', '')
-                print(f"Loaded credentials from: {config_file}")
-            else:
-                print("WARNING: No config file found, using placeholder values")
-                test_url = "https://www.saucedemo.com"
-                test_username = "standard_user"
-                test_password = "secret_sauce"
-            
-            # Login (Only if credentials provided AND login form is present)
-            if test_username and test_password:
-                print("Step: Navigate to login page and authenticate")
-                await page.goto(test_url)
-                await page.wait_for_load_state('networkidle')
-                
-                # Check if we need to login (is login button present?)
-                login_button_present = await page.locator('#login-button, input[type="submit"], button:has-text("Login")').first.is_visible(timeout=2000) if await page.locator('#login-button, input[type="submit"], button:has-text("Login")').count() > 0 else False
-                
-                if login_button_present:
-                    print("Step: Enter credentials")
-                    username_field = page.locator('input[name="user-name"], #user-name, input[type="text"]').first
-                    await username_field.fill(test_username)
-                    
-                    password_field = page.locator('input[name="password"], #password, input[type="password"]').first
-                    await password_field.fill(test_password)
-                    
-                    print("Step: Click login button")
-                    login_button = page.locator('input[type="submit"], #login-button, button:has-text("Login")').first
-                    await login_button.click()
-                    
-                    # Wait for navigation
-                    await page.wait_for_load_state('networkidle')
-                else:
-                    print("Step: Already logged in (login form not found, skipping)")
-            else:
-                print("Step: Navigate to application (No login required)")
-                await page.goto(test_url)
-                await page.wait_for_load_state('networkidle')
+        
+        # Load credentials from secure config file
+        import json
+        from pathlib import Path
+        config_file = Path(__file__).parent / "New - Dec-01_metadata.json"
+        
+        if config_file.exists():
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+                test_url = config.get('url', '')
+                test_username = config.get('username', '')
+                test_password = config.get('password', '')
+            print(f"Loaded credentials from: {config_file}")
+        else:
+            print("WARNING: No config file found, using placeholder values")
+            test_url = "https://www.saucedemo.com"
+            test_username = "standard_user"
+            test_password = "secret_sauce"
+        
+        # Login (Only if credentials provided AND login form is present)
+        if _auth_loaded:
+            # Session cookies already injected — go straight to the app
+            print("Step: Using cached login state from auth.json")
+            await page.goto(test_url.rstrip('/') + "/inventory.html", wait_until='domcontentloaded')
+        elif test_username and test_password:
+            print("Step: Navigate to login page and authenticate")
+            await _harness.login(page, test_url, test_username, test_password)
+        else:
+            print("Step: Navigate to application (No login required)")
+            await page.goto(test_url, wait_until='domcontentloaded')
 
-            
-            # Parse and execute test-specific steps
-            # Click action
-            print("  - Clicking #add-to-cart-sauce-labs-backpack")
-            btn = page.locator("#add-to-cart-sauce-labs-backpack").first
-            if await btn.is_visible():
-                await btn.click()
-            else:
-                # Fallback
-                await page.click("#add-to-cart-sauce-labs-backpack", timeout=2000)
-            await page.wait_for_load_state('networkidle')
-            # Click action
-            print("  - Clicking .shopping_cart_link, #shopping_cart_container a")
-            btn = page.locator(".shopping_cart_link, #shopping_cart_container a").first
-            if await btn.is_visible():
-                await btn.click()
-            else:
-                # Fallback
-                await page.click(".shopping_cart_link, #shopping_cart_container a", timeout=2000)
-            await page.wait_for_load_state('networkidle')
-            print("Step 3: Remove 'Sauce Labs Backpack' from cart using selector: #remove-sauce-labs-backpack")
-            await page.click("#remove-sauce-labs-backpack")
-            await page.wait_for_timeout(1000)
-            
-            print("Step 4: Open side menu using selector: #react-burger-menu-btn")
-            await page.click("#react-burger-menu-btn")
-            await page.wait_for_timeout(1000)
+        
+        # Parse and execute test-specific steps
+        # Click action — click() auto-waits for visibility/actionability
+        print("  - Clicking #add-to-cart-sauce-labs-backpack")
+        await page.locator("#add-to-cart-sauce-labs-backpack").click(timeout=5000)
+        # Click action — click() auto-waits for visibility/actionability
+        print("  - Clicking .shopping_cart_link")
+        await page.locator(".shopping_cart_link").click(timeout=5000)
+        print("Step 3: Remove 'Sauce Labs Backpack' from cart using selector: #remove-sauce-labs-backpack")
+        await page.click("#remove-sauce-labs-backpack")
+        
+        print("Step 4: Open side menu using selector: #react-burger-menu-btn")
+        await page.click("#react-burger-menu-btn")
 
-            # Click action
-            print("  - Clicking #logout_sidebar_link")
-            btn = page.locator("#logout_sidebar_link").first
-            if await btn.is_visible():
-                await btn.click()
-            else:
-                # Fallback
-                await page.click("#logout_sidebar_link", timeout=2000)
-            await page.wait_for_load_state('networkidle')
-            
-            print("Test PASSED ✓")
-            return "PASS"
-            
-        except Exception as e:
-            print(f"Test FAILED ✗: {str(e)}")
-            # Take screenshot on failure
+        # Click action — click() auto-waits for visibility/actionability
+        print("  - Clicking #logout_sidebar_link")
+        await page.locator("#logout_sidebar_link").click(timeout=5000)
+        
+        print("Test PASSED ✓")
+        return "PASS"
+        
+    except Exception as e:
+        print(f"Test FAILED ✗: {str(e)}")
+        # Best-effort screenshot — must never mask the real failure
+        try:
             await page.screenshot(path=f"failure_{test_id}.png")
-            return "FAIL"
-            
-        finally:
-            await browser.close()
+        except Exception as screenshot_error:
+            print(f"  (screenshot failed: {screenshot_error})")
+        return "FAIL"
+        
+
+async def main():
+    try:
+        return await _harness.with_context(test_tc001, storage_state=_harness.auth_state())
+    finally:
+        await _harness.shutdown()
 
 if __name__ == "__main__":
-    result = asyncio.run(test_tc001())
+    result = asyncio.run(main())
     print(f"Final Result: {result}")
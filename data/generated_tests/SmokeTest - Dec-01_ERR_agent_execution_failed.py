@@ -5,106 +5,80 @@ Suite: SmokeTest - Dec-01
 Generated: 2025-12-01 20:27:53
 """
 import asyncio
-from playwright.async_api import async_playwright, expect
+from playwright.async_api import expect
 import os
 
-async def test_err():
+import _harness
+
+async def test_err(context):
     """
     Agent Execution Failed
     
     Test Steps:
     1. Agent stopped without producing a result.\n    2. This is likely due to an API Rate Limit (429) or repeated errors.\n    3. Please wait a minute and try again.\n    """
     
-    async with async_playwright() as p:
-        # Launch with slow_mo for visibility and Chrome flags to suppress alerts
-        browser = await p.chromium.launch(
-            headless=False,
-            slow_mo=1000,  # 1 second delay per action
-            args=[
-                "--start-maximized",
-                "--disable-save-password-bubble",
-                "--disable-password-manager",
-                "--disable-infobars",
-                "--no-default-browser-check"
-            ]
-        )
-        # Create context with viewport=None to respect maximized window
-        context = await browser.new_context(no_viewport=True)
-        page = await context.new_page()
+    page = await context.new_page()
+    _auth_loaded = _harness.auth_state() is not None
+
+    try:
+        print(f"Starting test: Agent Execution Failed")
+        test_id = "ERR"
         
-        try:
-            print(f"Starting test: Agent Execution Failed")
-            test_id = "ERR"
-            
-            # Load credentials from secure config file
-            import json
-            from pathlib import Path
-            config_file = Path(__file__).parent / "SmokeTest - Dec-01_metadata.json"
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    config = json.load(f)
-                    test_url = config.get('url', '')
-                    test_username = config.get('username', '')
-                    test_password = config.get('password', '')
-                print(f"Loaded credentials from: {config_file}")
-            else:
-                print("WARNING: No config file found, using placeholder values")
-                test_url = "https://www.saucedemo.com"
-                test_username = "standard_user"
-                test_password = "secret_sauce"
-            
-            # Login (Only if credentials provided AND login form is present)
-            if test_username and test_password:
-                print("Step: Navigate to login page and authenticate")
-                await page.goto(test_url)
-                await page.wait_for_load_state('networkidle')
-                
-                # Check if we need to login (is login button present?)
-                login_button_present = await page.locator('#login-button, input[type="submit"], button:has-text("Login")').first.is_visible(timeout=2000) if await page.locator('#login-button, input[type="submit"], button:has-text("Login")').count() > 0 else False
-                
-                if login_button_present:
-                    print("Step: Enter credentials")
-                    username_field = page.locator('input[name="user-name"], #user-name, input[type="text"]').first
-                    await username_field.fill(test_username)
-                    
-                    password_field = page.locator('input[name="password"], #password, input[type="password"]').first
-                    await password_field.fill(test_password)
-                    
-                    print("Step: Click login button")
-                    login_button = page.locator('input[type="submit"], #login-button, button:has-text("Login")').first
-                    await login_button.click()
-                    
-                    # Wait for navigation
-                    await page.wait_for_load_state('networkidle')
-                else:
-                    print("Step: Already logged in (login form not found, skipping)")
-            else:
-                print("Step: Navigate to application (No login required)")
-                await page.goto(test_url)
-                await page.wait_for_load_state('networkidle')
+        # Load credentials from secure config file
+        import json
+        from pathlib import Path
+        config_file = Path(__file__).parent / "SmokeTest - Dec-01_metadata.json"
+        
+        if config_file.exists():
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+                test_url = config.get('url', '')
+                test_username = config.get('username', '')
+                test_password = config.get('password', '')
+            print(f"Loaded credentials from: {config_file}")
+        else:
+            print("WARNING: No config file found, using placeholder values")
+            test_url = "https://www.saucedemo.com"
+            test_username = "standard_user"
+            test_password = "secret_sauce"
+        
+        # Login (Only if credentials provided AND login form is present)
+        if _auth_loaded:
+            # Session cookies already injected — go straight to the app
+            print("Step: Using cached login state from auth.json")
+            await page.goto(test_url.rstrip('/') + "/inventory.html", wait_until='domcontentloaded')
+        elif test_username and test_password:
+            print("Step: Navigate to login page and authenticate")
+            await _harness.login(page, test_url, test_username, test_password)
+        else:
+            print("Step: Navigate to application (No login required)")
+            await page.goto(test_url, wait_until='domcontentloaded')
 
-            
-            # Parse and execute test-specific steps
-            print("Step 1: Agent stopped without producing a result.")
-            await page.wait_for_timeout(1000)
-            print("Step 2: This is likely due to an API Rate Limit (429) or repeated errors.")
-            await page.wait_for_timeout(1000)
-            print("Step 3: Please wait a minute and try again.")
-            await page.wait_for_timeout(1000)
-            
-            print("Test PASSED ✓")
-            return "PASS"
-            
-        except Exception as e:
-            print(f"Test FAILED ✗: {str(e)}")
-            # Take screenshot on failure
+        
+        # Parse and execute test-specific steps
+        print("Step 1: Agent stopped without producing a result.")
+        print("Step 2: This is likely due to an API Rate Limit (429) or repeated errors.")
+        print("Step 3: Please wait a minute and try again.")
+        
+        print("Test PASSED ✓")
+        return "PASS"
+        
+    except Exception as e:
+        print(f"Test FAILED ✗: {str(e)}")
+        # Best-effort screenshot — must never mask the real failure
+        try:
             await page.screenshot(path=f"failure_{test_id}.png")
-            return "FAIL"
-            
-        finally:
-            await browser.close()
+        except Exception as screenshot_error:
+            print(f"  (screenshot failed: {screenshot_error})")
+        return "FAIL"
+        
+
+async def main():
+    try:
+        return await _harness.with_context(test_err, storage_state=_harness.auth_state())
+    finally:
+        await _harness.shutdown()
 
 if __name__ == "__main__":
-    result = asyncio.run(test_err())
+    result = asyncio.run(main())
     print(f"Final Result: {result}")
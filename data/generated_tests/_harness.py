@@ -0,0 +1,195 @@
+"""
+Shared Playwright harness for generated tests.
+
+Launches Chromium once per process and hands each test case a fresh,
+isolated BrowserContext. Browser startup (~1-2s of CDP + profile init)
+is paid a single time instead of per file; contexts cost ~50ms each.
+"""
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+# Chrome flags for headed debugging (suppress password-save popups etc.) —
+# meaningless in headless runs, so only passed when PW_HEADFUL=1
+_HEADED_ARGS = [
+    "--disable-save-password-bubble",
+    "--disable-password-manager",
+    "--disable-infobars",
+    "--no-default-browser-check",
+]
+
+# In CI the real hazard is /dev/shm exhaustion crashing the renderer
+_CI_ARGS = [
+    "--disable-dev-shm-usage",
+    "--no-sandbox",
+]
+
+
+def chromium_args():
+    """Launch flags appropriate for the current environment."""
+    args = list(_CI_ARGS) if os.getenv("CI") == "1" else []
+    if os.getenv("PW_HEADFUL") == "1":
+        args += _HEADED_ARGS
+    return args
+
+# Cached login state written by auth_setup.py; older snapshots are ignored
+# so an expired server-side session can't strand every test on a login page
+AUTH_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "auth.json")
+AUTH_MAX_AGE = 1800  # seconds
+
+DEFAULT_CONFIG = {
+    "url": "https://www.saucedemo.com",
+    "username": "standard_user",
+    "password": "secret_sauce",
+}
+
+# Fixed small viewport: functional tests gain nothing from full-screen
+# overdraw, and a constant size keeps layouts deterministic for selectors
+VIEWPORT = {"width": 1280, "height": 720}
+
+_playwright = None
+_browser = None
+# Serializes the lazy launch: the await inside get_browser suspends between
+# the None check and the assignment, so concurrent first callers would each
+# launch their own Chromium without it
+_browser_lock = asyncio.Lock()
+
+# Parsed {suite}_metadata.json files, keyed by suite name
+_CONFIG_CACHE: dict = {}
+
+
+async def get_browser():
+    """Return the shared Browser, launching it lazily on first use."""
+    global _playwright, _browser
+    if _browser is None:
+        async with _browser_lock:
+            # Re-check under the lock — another caller may have won the race
+            if _browser is None:
+                _playwright = await async_playwright().start()
+                # saucedemo tags elements with data-test, not the default data-testid
+                _playwright.selectors.set_test_id_attribute("data-test")
+                _browser = await _playwright.chromium.launch(
+                    headless=os.getenv("PW_HEADFUL") != "1",
+                    slow_mo=int(os.getenv("PW_SLOWMO", "0")),
+                    args=chromium_args(),
+                )
+    return _browser
+
+
+# Resource types no generated test asserts on — aborting them shrinks each
+# navigation from dozens of requests to a handful
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+
+async def _block_nonessential(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def auth_state():
+    """Return the auth.json path when a fresh snapshot exists, else None."""
+    try:
+        if time.time() - os.path.getmtime(AUTH_FILE) < AUTH_MAX_AGE:
+            return AUTH_FILE
+    except OSError:
+        pass
+    return None
+
+
+async def with_context(test_fn, storage_state=None):
+    """Run *test_fn(context)* in a fresh BrowserContext on the shared browser."""
+    browser = await get_browser()
+    context = await browser.new_context(viewport=VIEWPORT, storage_state=storage_state)
+    await context.route("**/*", _block_nonessential)
+    try:
+        return await test_fn(context)
+    finally:
+        await context.close()
+
+
+def load_suite_config(suite_name):
+    """Return the parsed ``{suite_name}_metadata.json``, cached at module scope."""
+    config = _CONFIG_CACHE.get(suite_name)
+    if config is None:
+        metadata_file = Path(__file__).with_name(f"{suite_name}_metadata.json")
+        if metadata_file.exists():
+            config = {**DEFAULT_CONFIG, **json.loads(metadata_file.read_text())}
+        else:
+            config = dict(DEFAULT_CONFIG)
+        _CONFIG_CACHE[suite_name] = config
+    return config
+
+
+async def login(page, url, username, password):
+    """Navigate to *url* and log in via the canonical id selectors.
+
+    A page without a login form (already authenticated) is detected by the
+    first fill timing out and is treated as success.
+    """
+    if "saucedemo.com" in url:
+        # saucedemo accepts a preset session cookie as a login — zero DOM
+        # interaction instead of one navigation, two fills and a click
+        await page.context.add_cookies([{
+            "name": "session-username",
+            "value": username,
+            "domain": "www.saucedemo.com",
+            "path": "/",
+        }])
+        await page.goto(url.rstrip("/") + "/inventory.html", wait_until="domcontentloaded")
+        return
+
+    await page.goto(url, wait_until="domcontentloaded")
+    # The two fills touch independent fields — dispatch them concurrently to
+    # hide one CDP round-trip; only the click has to come last.
+    # return_exceptions keeps the sibling task's error from going unretrieved.
+    fill_results = await asyncio.gather(
+        page.locator("#user-name").fill(username, timeout=3000),
+        page.locator("#password").fill(password, timeout=3000),
+        return_exceptions=True,
+    )
+    if any(isinstance(result, PlaywrightTimeoutError) for result in fill_results):
+        print("Step: Already logged in (login form not found, skipping)")
+        return
+    for result in fill_results:
+        if isinstance(result, Exception):
+            raise result
+    await page.locator("#login-button").click()
+
+
+@asynccontextmanager
+async def login_page(context, suite_name):
+    """Yield a page navigated to the suite URL and logged in (if a form is shown)."""
+    config = load_suite_config(suite_name)
+    page = await context.new_page()
+    # 'commit' returns as soon as the response starts; the first fill below
+    # waits for the actual element, so no time is spent on third-party scripts
+    await page.goto(config["url"], wait_until="commit")
+    if config.get("username") and config.get("password"):
+        try:
+            # Single data-test locators — one selector-engine pass per lookup
+            # instead of a union over every defensive OR-branch
+            await page.get_by_test_id("username").fill(config["username"], timeout=5000)
+            await page.get_by_test_id("password").fill(config["password"])
+            await page.get_by_test_id("login-button").click()
+        except PlaywrightTimeoutError:
+            pass  # no login form — already authenticated
+    yield page
+
+
+async def shutdown():
+    """Close the shared browser and stop Playwright (call once per process)."""
+    global _playwright, _browser
+    if _browser is not None:
+        await _browser.close()
+        _browser = None
+    if _playwright is not None:
+        await _playwright.stop()
+        _playwright = None
@@ -0,0 +1,39 @@
+"""
+One-time login bootstrap for the generated test suite.
+
+Logs into the application and saves the authenticated storage state to
+auth.json next to this script. The generated tests pick the file up
+automatically and skip the whole login flow (~3-5s each) on warm runs.
+
+Usage:
+    python auth_setup.py
+"""
+import asyncio
+import os
+
+from playwright.async_api import async_playwright
+
+from _harness import AUTH_FILE
+
+URL = os.getenv("APP_LOGIN_URL", "https://www.saucedemo.com")
+USERNAME = os.getenv("APP_USERNAME", "standard_user")
+PASSWORD = os.getenv("APP_PASSWORD", "secret_sauce")
+
+
+async def main() -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=os.getenv("PW_HEADFUL") != "1")
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.goto(URL, wait_until="domcontentloaded")
+        await page.locator("#user-name").fill(USERNAME)
+        await page.locator("#password").fill(PASSWORD)
+        await page.locator("#login-button").click()
+        await page.locator(".inventory_list").wait_for(state="visible", timeout=10000)
+        await context.storage_state(path=AUTH_FILE)
+        await browser.close()
+        print(f"Saved login state to {AUTH_FILE}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
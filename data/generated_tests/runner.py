@@ -0,0 +1,103 @@
+"""
+Parallel runner for the generated test scripts.
+
+Loads each generated module and runs every test case concurrently on the
+shared browser from _harness — one isolated BrowserContext per test — so
+suite wall-clock is the slowest test instead of the sum of all three.
+
+For CI scale-out the suite can be sharded across processes/machines,
+Playwright-style: ``python runner.py --shard 1/4`` runs the first of four
+interleaved shards, each with its own browser.
+
+Usage:
+    python runner.py [--shard INDEX/TOTAL]
+"""
+import argparse
+import asyncio
+import importlib.util
+import re
+from pathlib import Path
+
+import _harness
+
+# Infrastructure modules that live next to the generated tests
+_NON_TEST_FILES = {"_harness.py", "runner.py", "auth_setup.py"}
+
+# Only harness-style entrypoints taking a BrowserContext qualify. Raw
+# codegen saves (async def run(playwright) plus a module-level
+# asyncio.run(...)) must not match: importing one would start a second
+# event loop inside the runner's, and run(playwright) can't be driven
+# through with_context anyway.
+_ENTRYPOINT_RE = re.compile(r"^async def (test_\w+|run)\(context\b", re.MULTILINE)
+
+
+def discover_tests() -> list:
+    """Return (module file, entrypoint) pairs for every generated test module.
+
+    Entrypoints are found with a static source scan so newly generated
+    suites join the parallel run without manual registration.
+    """
+    tests = []
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        if path.name in _NON_TEST_FILES or path.name.startswith("recording_"):
+            continue
+        match = _ENTRYPOINT_RE.search(path.read_text())
+        if match:
+            tests.append((path.name, match.group(1)))
+    return tests
+
+
+TESTS = discover_tests()
+
+
+def _load_entrypoint(filename: str, attr: str):
+    """Import a generated test module by path (names contain dashes)."""
+    path = Path(__file__).with_name(filename)
+    spec = importlib.util.spec_from_file_location(path.stem.replace("-", "_"), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, attr)
+
+
+def _select_shard(tests: list, shard: str) -> list:
+    """Return the tests belonging to shard INDEX/TOTAL (1-based, interleaved)."""
+    index, total = (int(part) for part in shard.split("/"))
+    if not 1 <= index <= total:
+        raise SystemExit(f"invalid --shard {shard!r}: INDEX must be in 1..TOTAL")
+    return tests[index - 1 :: total]
+
+
+async def main(shard: str = None) -> list:
+    tests = _select_shard(TESTS, shard) if shard else TESTS
+    entrypoints = [_load_entrypoint(filename, attr) for filename, attr in tests]
+    # Seed every context from auth.json like the per-file main()s do — the
+    # tests skip their login flow whenever auth_state() is fresh, so a
+    # runner context without the cookies would land on the login redirect
+    storage_state = _harness.auth_state()
+    try:
+        results = await asyncio.gather(
+            *(_harness.with_context(entry, storage_state=storage_state) for entry in entrypoints),
+            return_exceptions=True,
+        )
+    finally:
+        await _harness.shutdown()
+
+    for (filename, _), result in zip(tests, results):
+        outcome = "ERROR: " + repr(result) if isinstance(result, Exception) else result
+        print(f"{filename}: {outcome}")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the generated test suite")
+    parser.add_argument(
+        "--shard",
+        metavar="INDEX/TOTAL",
+        help="run only the INDEX-th (1-based) of TOTAL interleaved shards",
+    )
+    args = parser.parse_args()
+
+    # One long-lived loop for the whole suite: the Playwright node driver and
+    # CDP websocket are initialized once and reused by every test.
+    with asyncio.Runner() as loop_runner:
+        loop_runner.run(main(shard=args.shard))
@@ -2,6 +2,8 @@
 Autonomous Test Agent — Main Entry Point
 Starts the FastAPI server for the AI-powered browser testing system.
 """
+import os
+
 import uvicorn
 
 if __name__ == "__main__":
@@ -14,9 +16,14 @@ if __name__ == "__main__":
     print("  Press CTRL+C to stop")
     print("=" * 60)
 
+    # reload=True spawns a StatReload watcher that stats every source file
+    # ~4x/second — dev-only cost, so it's opt-in. Without reload, WORKERS
+    # preforked processes share the listening socket across cores.
+    reload = os.environ.get("DEV_RELOAD", "0") == "1"
     uvicorn.run(
         "src.core.server:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=reload,
+        workers=1 if reload else int(os.environ.get("WORKERS", "1")),
     )
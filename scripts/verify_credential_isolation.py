@@ -13,8 +13,12 @@ Exit Codes:
     1: Violations detected (review required)
 """
 
+import argparse
 import ast
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict
 
@@ -65,7 +69,7 @@ class CredentialLeakDetector(ast.NodeVisitor):
                         'function': self.current_function or '<module>',
                         'line': node.lineno,
                         'issue': 'Credentials passed to LLM call',
-                        'code': ast.unparse(node) if hasattr(ast, 'unparse') else '<code>'
+                        '_node': node  # unparsed lazily at report time
                     })
             
             # Check keyword arguments
@@ -76,66 +80,76 @@ class CredentialLeakDetector(ast.NodeVisitor):
                         'function': self.current_function or '<module>',
                         'line': node.lineno,
                         'issue': f'Credentials in keyword argument: {keyword.arg}',
-                        'code': ast.unparse(node) if hasattr(ast, 'unparse') else '<code>'
+                        '_node': node  # unparsed lazily at report time
                     })
         
         self.generic_visit(node)
    
+    # Compiled alternations: one C-level scan per identifier instead of a
+    # Python-level loop over substrings (and no .lower() allocation)
+    _NAME_RE = re.compile(r'username|password|credentials|secret|passwd|pwd|secrets_manager', re.IGNORECASE)
+    _ATTR_RE = re.compile(r'username|password|secret', re.IGNORECASE)
+
     def _contains_credentials(self, node) -> bool:
         """
-        Recursively check if an AST node references credentials.
-        
+        Check if an AST node (or anything nested in it) references credentials.
+
         Detects:
         - Variable names: username, password, secret, credentials
         - Attribute access: obj.username, secrets_manager.password
-        - F-strings containing credential variables
+        - F-strings, concatenation, format() calls — anything reachable from
+          the node, via one iterative ast.walk pass instead of type-by-type
+          recursion
         """
-        # Check simple variable names
-        if isinstance(node, ast.Name):
-            suspicious_names = ['username', 'password', 'credentials', 'secret', 'passwd', 'pwd', 'secrets_manager']
-            if any(name in node.id.lower() for name in suspicious_names):
-                return True
-        
-        # Check attribute access (obj.username)
-        if isinstance(node, ast.Attribute):
-            if self._contains_credentials(node.value):
-                return True
-            suspicious_attrs = ['username', 'password', 'secret']
-            if any(attr in node.attr.lower() for attr in suspicious_attrs):
-                return True
-        
-        # Check f-strings and formatted strings
-        if isinstance(node, ast.JoinedStr):
-            for value in node.values:
-                if isinstance(value, ast.FormattedValue):
-                    if self._contains_credentials(value.value):
-                        return True
-        
-        # Check string concatenation
-        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
-            if self._contains_credentials(node.left) or self._contains_credentials(node.right):
-                return True
-        
-        # Check format() calls
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Attribute) and node.func.attr == 'format':
-                for arg in node.args:
-                    if self._contains_credentials(arg):
-                        return True
-        
+        for sub in ast.walk(node):
+            if isinstance(sub, ast.Name):
+                if self._NAME_RE.search(sub.id):
+                    return True
+            elif isinstance(sub, ast.Attribute):
+                if self._ATTR_RE.search(sub.attr):
+                    return True
         return False
 
-def analyze_file(filepath: Path) -> List[Dict]:
+def _walk_py(root: str):
+    """
+    Yield every .py file path under *root*.
+
+    Uses os.scandir recursion instead of Path.glob('**/*.py') — raw string
+    paths and dirent-based type checks avoid the per-entry Path allocations
+    and stat calls that dominate on large trees.
+    """
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from _walk_py(entry.path)
+        elif entry.name.endswith('.py'):
+            yield entry.path
+
+# ast.unparse reconstructs source (hundreds of microseconds); defer it to
+# report time so the scan path never pays for it
+_HAS_UNPARSE = hasattr(ast, 'unparse')
+
+# Cheap byte-level pre-filter: a file containing none of these substrings
+# cannot produce a violation, so it can skip AST parsing entirely
+_CREDENTIAL_KEYWORDS = (b'password', b'passwd', b'pwd', b'secret', b'credential', b'username')
+
+def analyze_file(filepath: str) -> List[Dict]:
     """
     Analyze a Python file for credential leaks.
-    
+
     Returns:
         List of violation dictionaries
     """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            source_code = f.read()
-        
+        with open(filepath, 'rb') as f:
+            raw = f.read()
+
+        # bytes.find is a C-level scan; ast.parse allocates thousands of nodes.
+        # Most files mention no credential keyword at all — skip them outright.
+        lowered = raw.lower()
+        if not any(keyword in lowered for keyword in _CREDENTIAL_KEYWORDS):
+            return []
+
+        source_code = raw.decode('utf-8')
         tree = ast.parse(source_code, filename=str(filepath))
         detector = CredentialLeakDetector(str(filepath))
         detector.visit(tree)
@@ -151,6 +165,14 @@ def analyze_file(filepath: Path) -> List[Dict]:
 
 def main():
     """Run analysis on all source files"""
+    parser = argparse.ArgumentParser(description="Verify credential isolation")
+    parser.add_argument(
+        '--serial',
+        action='store_true',
+        help='analyze files one at a time instead of across CPU cores (debugging)',
+    )
+    args = parser.parse_args()
+
     print("🔬 Static Code Analysis: Credential Isolation Verification")
     print("=" * 70)
     
@@ -164,22 +186,29 @@ def main():
         print(f"❌ Source directory not found: {src_dir}")
         sys.exit(1)
     
-    py_files = list(src_dir.glob('**/*.py'))
+    py_files = sorted(_walk_py(str(src_dir)))
     print(f"📁 Analyzing {len(py_files)} Python files in {src_dir}")
     print()
-    
-    # Analyze each file
+
+    # Analyze each file — AST parsing is CPU-bound pure-Python work, so fan it
+    # out across cores; chunksize amortizes IPC against the ~1-5ms per-file cost
+    if args.serial:
+        results = [analyze_file(filepath) for filepath in py_files]
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(analyze_file, py_files, chunksize=8))
+
     all_violations = []
     files_with_violations = []
-    
-    for filepath in py_files:
-        violations = analyze_file(filepath)
+    root_len = len(str(project_root)) + 1  # for display-only relative paths
+
+    for filepath, violations in zip(py_files, results):
         if violations:
             all_violations.extend(violations)
             files_with_violations.append(filepath)
-            print(f"⚠️  {filepath.relative_to(project_root)}: {len(violations)} violation(s)")
+            print(f"⚠️  {filepath[root_len:]}: {len(violations)} violation(s)")
         else:
-            print(f"✅ {filepath.relative_to(project_root)}")
+            print(f"✅ {filepath[root_len:]}")
     
     print()
     print("=" * 70)
@@ -195,8 +224,9 @@ def main():
             print(f"   Function: {violation['function']}")
             print(f"   Line: {violation['line']}")
             print(f"   Issue: {violation['issue']}")
-            if 'code' in violation:
-                print(f"   Code: {violation['code'][:100]}...")
+            if '_node' in violation:
+                code = ast.unparse(violation['_node']) if _HAS_UNPARSE else '<code>'
+                print(f"   Code: {code[:100]}...")
         
         print()
         print("=" * 70)
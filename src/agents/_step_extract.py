@@ -0,0 +1,75 @@
+"""
+Fallback step extraction for recorded Playwright code.
+
+Lives in its own fully-typed module with no imports beyond ``re`` so it can
+be compiled with mypyc/Cython as an optional build step; the pure-Python
+form here is the dev-mode fallback and the only one this repo ships.
+"""
+import re
+from typing import List
+
+# Single alternation scanned once over the whole recording. Compound
+# branches (data-test + fill/click, get_by_role + click) use [^\n]*? so a
+# match never spans lines, keeping per-line correlation; the branch that
+# fired is recovered from m.lastgroup.
+_ACTION_RE = re.compile(
+    r'goto\(["\'](?P<url>[^"\' ]+)["\']\)'
+    r'|data-test=["\\]*(?P<fill_field>[^"\\]+)["\\]*[^\n]*?\.fill\(["\'](?P<fill_val>[^"\' ]+)["\']\)'
+    r'|\.fill\(["\'](?P<bare_fill_val>[^"\' ]+)["\']\)'
+    r'|get_by_role\(["\'](?P<role>[^"\' ]+)["\'],\s*name=["\'](?P<role_name>[^"\' ]+)["\']\)[^\n]*?\.click\(\)'
+    r'|data-test=["\\]*(?P<click_field>[^"\\]+)["\\]*[^\n]*?\.click\(\)'
+    r'|(?P<click>\.click\(\))'
+    r'|(?P<old_click>page\.click\()'
+    r'|(?P<old_fill>page\.fill\()'
+    r'|(?P<old_type>page\.type\()'
+    r'|(?P<expect>expect\()'
+    r'|(?P<press>page\.press\()'
+    r'|(?P<close>page\.close\(\))'
+)
+
+
+def extract_steps(code: str) -> List[str]:
+    """
+    Extract basic English steps from Playwright code without an LLM.
+
+    Handles both old (page.click) and new (locator().click) syntax in one
+    C-level scan; m.lastgroup names the alternation branch that matched.
+    """
+    steps: List[str] = []
+
+    for m in _ACTION_RE.finditer(code):
+        kind = m.lastgroup
+
+        # Navigation
+        if kind == 'url':
+            step = f'Navigate to "{m.group("url")}"'
+
+        # Fill (new syntax: locator().fill()), with/without data-test field
+        elif kind == 'fill_val':
+            step = f'Enter "{m.group("fill_val")}" in {m.group("fill_field")} field'
+        elif kind == 'bare_fill_val':
+            step = f'Enter "{m.group("bare_fill_val")}" in field'
+
+        # Click (new syntax: locator().click() or get_by_role().click())
+        elif kind == 'role_name':
+            step = f'Click "{m.group("role_name")}" {m.group("role")}'
+        elif kind == 'click_field':
+            step = f'Click {m.group("click_field")}'
+        elif kind == 'click' or kind == 'old_click':
+            step = 'Click element'
+
+        # Old syntax patterns (for compatibility)
+        elif kind == 'old_fill':
+            step = 'Fill field'
+        elif kind == 'old_type':
+            step = 'Type in field'
+        elif kind == 'expect':
+            step = 'Verify element'
+        elif kind == 'press':
+            step = 'Press key'
+        else:  # close
+            step = 'Close page'
+
+        steps.append(step)
+
+    return steps
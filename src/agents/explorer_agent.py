@@ -15,16 +15,56 @@ except ImportError:
     AUDIT_AVAILABLE = False
     print("⚠️  AuditLogger not available - security audit disabled")
 
-async def explore_and_generate_tests(start_url: str, user_description: str, secrets_manager=None, headless: bool = False):
+# Chromium flags for the exploration browser, built once at import
+_CHROMIUM_ARGS = (
+    "--start-maximized",
+    "--disable-save-password-bubble",
+    "--disable-infobars",
+    "--no-default-browser-check",
+    "--disable-popup-blocking",
+    "--disable-password-manager",
+    "--disable-features=PasswordBreachDetection,PasswordProtectionWarningTrigger,PasswordManager,OptimizationGuideModelDownloading,OptimizationHintsFetching,SafeBrowsingProtectionLevelToRequests,AutofillServerCommunication",
+    "--password-store=basic",
+    "--no-service-autorun",
+    "--force-device-scale-factor=1",  # Normal zoom level
+)
+
+# One real login per process: the first run to authenticate a URL stores its
+# session cookies here, and concurrent/later runs replay them into their own
+# context instead of driving the login UI again (seconds per run). The lock
+# serializes the first login so parallel callers don't all pay it.
+_SESSION_CACHE: dict[str, list] = {}
+_SESSION_LOCK = asyncio.Lock()
+
+async def _wait_for_dom(page, timeout: float = 5.0) -> None:
+    """
+    Wait until the page has a parsed DOM, polling instead of sleeping blind.
+
+    browser_use's Page.goto takes no wait_until argument, so this is the
+    nearest equivalent of domcontentloaded: fast pages return in ~100ms
+    rather than paying a fixed multi-second sleep.
+    """
+    deadline = asyncio.get_event_loop().time() + timeout
+    while asyncio.get_event_loop().time() < deadline:
+        try:
+            if await page.get_elements_by_css_selector("body"):
+                return
+        except Exception:
+            pass  # page still navigating
+        await asyncio.sleep(0.1)
+
+async def explore_and_generate_tests(start_url: str, user_description: str, secrets_manager=None, headless: bool = False, wait_between_actions: float = 0.0):
     """
     Launches a browser, explores the website, and generates test cases.
-    
+
     Args:
         start_url: The application URL to explore
         user_description: User's description of what to test
         secrets_manager: Optional SecretsManager for login credentials
         headless: Whether to run browser in headless mode (default: False)
-    
+        wait_between_actions: Extra delay per agent action, in seconds.
+            Defaults to 0 — only set this when watching the run live.
+
     Returns:
         str: JSON string containing test cases
     """
@@ -32,42 +72,23 @@ async def explore_and_generate_tests(start_url: str, user_description: str, secr
     
     llm = get_llm()
     
-    # Headful browser to visualize the exploration
-    # IMPORTANT: Configuration passed directly to Browser for visibility
-    # Headful browser to visualize the exploration
-    # IMPORTANT: Configuration passed directly to Browser for visibility
-    # Reverting to using BrowserProfile for args as this was confirmed working previously
     # Headful browser to visualize the exploration
     # IMPORTANT: Configuration passed directly to Browser for visibility
     browser = Browser(
-        args=[
-            "--start-maximized",
-            "--disable-save-password-bubble",
-            "--disable-infobars",
-            "--no-default-browser-check",
-            "--disable-popup-blocking",
-            "--disable-password-manager",
-            "--disable-features=PasswordBreachDetection,PasswordProtectionWarningTrigger,PasswordManager,OptimizationGuideModelDownloading,OptimizationHintsFetching,SafeBrowsingProtectionLevelToRequests,AutofillServerCommunication",
-            "--password-store=basic",
-            "--no-service-autorun",
-            "--force-device-scale-factor=1",  # Normal zoom level
-        ],
+        args=list(_CHROMIUM_ARGS),
         headless=headless,  # Use user's preference from UI toggle
-        wait_between_actions=1.0,  # 1 second delay (faster than 3s, still visible)
+        wait_between_actions=wait_between_actions,
         highlight_elements=True,  # Yellow highlights on elements
     )
     await browser.start()
-    
+
     # Make browser window visible and bring to front
     if headless:
         print("🌐 Browser started in HEADLESS mode (background, no window)")
     else:
         print("🌐 Browser window opened - should be visible now")
-        print("⏱️  BALANCED MODE: 1-second delay between actions for speed + visibility!")
-
-    
-    # Add a small delay to ensure window is visible
-    await asyncio.sleep(2)
+        # Small delay to ensure the window is visible before actions start
+        await asyncio.sleep(2)
 
     # ===== ZERO-TRUST SECURITY: LOGIN BEFORE AI =====
     # We handle authentication HERE, BEFORE the AI Agent runs
@@ -77,20 +98,43 @@ async def explore_and_generate_tests(start_url: str, user_description: str, secr
     temp_page = await browser.new_page()
     
     if secrets_manager:
-        # Try to load cached session first (optimization)
-        session_loaded = await secrets_manager.try_load_cached_session(temp_page)
-        
-        if not session_loaded:
-            # No cache - perform fresh login
-            print("🔐 SECURE: No cached session. Performing fresh login (AI EXCLUDED)...")
-            await secrets_manager.inject_login(temp_page)
-        else:
-            print("💾 SECURE: Loaded cached session. Skipping login (AI EXCLUDED)...")
+        # In-process cookie cache first (no disk I/O, no login UI), then the
+        # on-disk session cache, then a real login — under _SESSION_LOCK so
+        # parallel runs serialize the one real login.
+        session_loaded = False
+        async with _SESSION_LOCK:
+            cookies = _SESSION_CACHE.get(start_url)
+            if cookies is None:
+                session_loaded = await secrets_manager.try_load_cached_session(temp_page)
+
+                if not session_loaded:
+                    # No cache - perform fresh login
+                    print("🔐 SECURE: No cached session. Performing fresh login (AI EXCLUDED)...")
+                    await secrets_manager.inject_login(temp_page)
+                else:
+                    print("💾 SECURE: Loaded cached session. Skipping login (AI EXCLUDED)...")
+
+                try:
+                    _SESSION_CACHE[start_url] = await temp_page.context.cookies()
+                except Exception as exc:
+                    print(f"⚠️  Could not cache session cookies in-process: {exc}")
+
+        if cookies is not None:
+            print("💾 SECURE: Reusing in-process session cookies. Skipping login (AI EXCLUDED)...")
+            await temp_page.context.add_cookies(cookies)
+
+        # The cookie paths authenticate without rendering anything (the
+        # disk cache may validate purely from cookie expiry), but the agent
+        # is told it starts on the application page — make that true. Only
+        # the fresh login already leaves the page on the app itself.
+        if cookies is not None or session_loaded:
+            await temp_page.goto(start_url)
+            await _wait_for_dom(temp_page)
     else:
         # No secrets manager - just navigate to start URL
         print("⚠️  No credentials provided. Navigating to URL without login...")
         await temp_page.goto(start_url)
-        await asyncio.sleep(2)
+        await _wait_for_dom(temp_page)
     
     
     # Note: We don't close temp_page because browser-use Page objects don't have a close() method
@@ -199,9 +243,10 @@ EXAMPLE OUTPUT FORMAT:
             except Exception as e:
                 print(f"⚠️  Failed to generate audit report: {e}")
             
-        # Keep browser open for 10 seconds so you can see the final state
-        print("⏸️  Keeping browser open for 10 seconds to see final state...")
-        await asyncio.sleep(10)
+        if not headless:
+            # Keep browser open for 10 seconds so you can see the final state
+            print("⏸️  Keeping browser open for 10 seconds to see final state...")
+            await asyncio.sleep(10)
         
         final_result = history.final_result()
         
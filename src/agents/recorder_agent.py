@@ -3,19 +3,73 @@ Playwright Recorder Agent
 Records browser interactions using Playwright codegen and converts to test cases
 """
 import asyncio
-import subprocess
+import hashlib
 import os
 import re
 import json
+import shutil
 import uuid
 from datetime import datetime
 from typing import Dict, Optional, List
-from src.llm.llm_factory import get_llm
-from src.agents.recorder_logger import RecorderLogger
+import logging
+
+from src.agents._step_extract import extract_steps
+from src.agents.recorder_logger import RecorderLogger, recorder_logger
 
 # Session storage for active recording sessions
 RECORDING_SESSIONS: Dict[str, Dict] = {}
 
+# LLM-backed step conversion is opt-in: stop_recording uses the fast
+# deterministic fallback, and keeping the provider SDK import graph out of
+# module scope keeps importing the recorder cheap
+_USE_LLM_STEPS = os.getenv('USE_LLM_STEPS', 'false').lower() == 'true'
+
+# Content-addressed cache of LLM step conversions: re-records of the same
+# flow hash to the same key and skip the LLM call (and its token cost)
+# entirely for the process lifetime
+_STEP_CACHE: Dict[str, List[str]] = {}
+
+# The codegen recorder is only reachable through the Playwright CLI — the
+# Python API exposes no way to attach a recorder to a pooled browser — so
+# each session pays one CLI spawn. Resolve the executable path once here
+# instead of a PATH search per session.
+_PLAYWRIGHT_CLI = shutil.which("playwright") or "playwright"
+
+# Static instructions for the code→steps conversion. Kept as a fixed system
+# message so providers can cache the prefix: Anthropic via the ephemeral
+# cache_control flag on the message, OpenAI automatically for a stable prefix.
+_CONVERSION_INSTRUCTIONS = """You are a QA test documentation expert. Convert the following Playwright test code into clear, human-readable test steps.
+
+Requirements:
+- Each step should start with an action verb (Navigate, Click, Enter, Verify, etc.)
+- Reference business intent, not technical selectors
+- Be concise but descriptive
+- Make it readable by non-technical users
+- Generate ONE step for EACH line of action code
+
+Return ONLY a JSON array of step descriptions, like:
+["Navigate to the application", "Enter username in login field", "Click submit button"]
+
+Do NOT include explanations or any text outside the JSON array.
+"""
+
+def _read_from(path: str, offset: int) -> bytes:
+    """Blocking read of everything after *offset*, run off-loop via to_thread."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        return f.read()
+
+def _read_text(path: str) -> str:
+    """
+    Blocking file read, meant to run off the event loop via to_thread.
+
+    Reads bytes and decodes once — skipping TextIOWrapper's incremental
+    decoder and newline translation, which is the cheapest read path short
+    of platform-specific I/O rings.
+    """
+    with open(path, 'rb') as f:
+        return f.read().decode('utf-8', errors='replace')
+
 class RecorderAgent:
     """
     Agent for recording browser interactions using Playwright codegen
@@ -23,6 +77,8 @@ class RecorderAgent:
     
     def __init__(self):
         self.sessions = RECORDING_SESSIONS
+        # Per-suite test-case counters backing _generate_test_id
+        self._suite_counts: Dict[str, int] = {}
     
     async def start_recording(self, config: Dict) -> Dict:
         """
@@ -49,14 +105,14 @@ class RecorderAgent:
         RecorderLogger.log_session_start(session_id, config)
         
         # Build playwright codegen command
-        cmd = ["playwright", "codegen"]
+        cmd = [_PLAYWRIGHT_CLI, "codegen"]
         
         # Create output file for capturing code
         # Use system temp directory to avoid triggering server reload
         import tempfile
         output_dir = os.path.join(tempfile.gettempdir(), "playwright_recordings")
         output_file = f"{output_dir}/recording_{session_id}.py"
-        os.makedirs(output_dir, exist_ok=True)
+        await asyncio.to_thread(os.makedirs, output_dir, exist_ok=True)
         
         RecorderLogger.log_file_operation("Creating output file", output_file)
         
@@ -77,13 +133,14 @@ class RecorderAgent:
         
         # Start the codegen process
         try:
-            # Launch codegen with output capture
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1
+            # Launch codegen via the event loop so the server keeps serving
+            # while sessions record. The code is read from the -o output
+            # file, not stdout, so there's no reason to hold pipes open —
+            # a full pipe buffer would block codegen mid-recording.
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
             )
             
             RecorderLogger.log_process_info(process.pid, "started")
@@ -97,9 +154,19 @@ class RecorderAgent:
                 "status": "recording",
                 "started_at": datetime.now().isoformat(),
                 "output_file": output_file,
-                "stdout_lines": [],
-                "stderr_lines": []
+                # incremental tail-parse state
+                "tail_offset": 0,
+                "tail_pending": b"",
+                "code_parts": [],
+                "steps": []
             }
+
+            # Follow the output file while the user records: codegen appends
+            # continuously, so most of the read + step extraction is done by
+            # the time stop_recording is called
+            self.sessions[session_id]["tail_task"] = asyncio.create_task(
+                self._tail_output_file(session_id)
+            )
             
             print(f"✅ Recording session started: {session_id} (PID: {process.pid})")
             print(f"   Command: {' '.join(cmd)}")
@@ -116,6 +183,38 @@ class RecorderAgent:
             print(f"❌ Failed to start recording: {str(e)}")
             raise Exception(f"Failed to start Playwright codegen: {str(e)}")
     
+    async def _tail_output_file(self, session_id: str) -> None:
+        """
+        Incrementally read and parse the codegen output while recording.
+
+        Polls for appended bytes every 250ms, extracts steps from the
+        complete lines and accumulates both in the session, hiding the
+        read/parse latency behind the user's own interaction time.
+        """
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+
+        output_file = session["output_file"]
+        while session.get("status") == "recording":
+            await asyncio.sleep(0.25)
+            try:
+                chunk = await asyncio.to_thread(_read_from, output_file, session["tail_offset"])
+            except FileNotFoundError:
+                continue  # codegen hasn't created the file yet
+            if not chunk:
+                continue
+            session["tail_offset"] += len(chunk)
+
+            # Only complete lines are parsed; a trailing partial line waits
+            # for its newline so mid-write matches can't be split
+            complete, newline, partial = (session["tail_pending"] + chunk).rpartition(b'\n')
+            session["tail_pending"] = partial
+            if newline:
+                text = complete.decode('utf-8', errors='replace') + '\n'
+                session["code_parts"].append(text)
+                session["steps"].extend(extract_steps(text))
+
     async def stop_recording(self, session_id: str) -> Dict:
         """
         Stop a recording session and capture the generated code
@@ -139,23 +238,44 @@ class RecorderAgent:
         try:
             # IMMEDIATE KILL - No graceful termination, it takes 2.5+ minutes!
             # Playwright codegen doesn't need graceful shutdown, file is already written
-            print(f"⚡ Immediately killing Playwright process {process.pid}")
-            process.kill()  # SIGKILL - instant death
+            # Codegen normally exits on its own when the user closes the
+            # browser window, and asyncio's kill() raises on a dead child
+            # (unlike Popen.kill) — only signal a live one
+            if process.returncode is None:
+                print(f"⚡ Immediately killing Playwright process {process.pid}")
+                try:
+                    process.kill()  # SIGKILL - instant death
+                except ProcessLookupError:
+                    pass  # exited between the check and the signal
             
-            # Wait max 2 seconds for process cleanup
+            # Wait max 2 seconds for process cleanup — awaiting instead of
+            # blocking, so the event loop keeps serving other sessions
             try:
-                stdout, stderr = process.communicate(timeout=2)
-                session["stdout"] = stdout
-                session["stderr"] = stderr
+                await asyncio.wait_for(process.wait(), timeout=2.0)
                 print(f"✅ Process {process.pid} terminated successfully")
-            except subprocess.TimeoutExpired:
+            except asyncio.TimeoutError:
                 print(f"⚠️  Process {process.pid} didn't die after SIGKILL (rare system issue)")
-                stdout, stderr = b"", b""
-                session["stdout"] = stdout
-                session["stderr"] = stderr
             
             session["status"] = "stopped"
             session["stopped_at"] = datetime.now().isoformat()
+
+            # Let the tailer finish its current iteration before the final
+            # read so offsets can't move underneath it
+            tail_task = session.pop("tail_task", None)
+            if tail_task:
+                tail_task.cancel()
+                try:
+                    await tail_task
+                except asyncio.CancelledError:
+                    pass
+
+            # Free the subprocess handle now and evict the whole session
+            # after a grace window for status polls — the module-level dict
+            # would otherwise grow for the life of the server
+            session.pop("process", None)
+            asyncio.get_running_loop().call_later(
+                300, self.sessions.pop, session_id, None
+            )
             
             RecorderLogger.log_process_info(process.pid, "stopped")
             print(f"✅ Recording stopped: {session_id}")
@@ -163,17 +283,26 @@ class RecorderAgent:
             # Get the output file path
             output_file = session.get("output_file", None)
             
-            # Read the generated code from the file
-            # Note: Playwright codegen writes to file continuously, so it should exist
+            # Finalize from the tailer's state: it has usually read and
+            # parsed everything already, so only bytes appended since its
+            # last poll are left
             playwright_code = ""
-            if output_file and os.path.exists(output_file):
-                with open(output_file, 'r') as f:
-                    playwright_code = f.read()
-                RecorderLogger.log_file_operation("Read code from file", output_file)
-                print(f"   Read {len(playwright_code)} bytes of code from {output_file}")
-            else:
+            try:
+                # Open directly instead of exists()+open — one fewer stat
+                # and no TOCTOU race between the check and the read
+                remainder = await asyncio.to_thread(
+                    _read_from, output_file, session.get("tail_offset", 0)
+                )
+            except (FileNotFoundError, TypeError):
                 RecorderLogger.log_warning(f"Output file not found: {output_file}")
                 print(f"⚠️  Warning: Output file not found: {output_file}")
+            else:
+                tail_text = (session.get("tail_pending", b"") + remainder).decode('utf-8', errors='replace')
+                playwright_code = "".join(session.get("code_parts", [])) + tail_text
+                if tail_text:
+                    session.setdefault("steps", []).extend(extract_steps(tail_text))
+                RecorderLogger.log_file_operation("Read code from file", output_file)
+                print(f"   Read {len(playwright_code)} bytes of code from {output_file}")
             
             # Check if we captured any code
             if not playwright_code or len(playwright_code.strip()) == 0:
@@ -182,10 +311,18 @@ class RecorderAgent:
                 playwright_code = "# No actions recorded\n# Please ensure you perform actions in the browser before stopping"
                 english_steps = ["No actions were recorded - browser was closed without interactions"]
             else:
-                # SKIP LLM - Use fallback directly for reliability and speed
-                # The LLM call often hangs/times out, but fallback works perfectly
-                print("📋 Extracting steps using fallback method (fast & reliable)")
-                english_steps = self._extract_steps_from_code(playwright_code)
+                if _USE_LLM_STEPS:
+                    # Opt-in LLM conversion, routed through the batch entry
+                    # point (hash-cached, cacheable prefix, extractor
+                    # fallback on any failure)
+                    english_steps = (await self._convert_many([playwright_code]))[0]
+                else:
+                    # SKIP LLM - Use fallback directly for reliability and speed
+                    # The LLM call often hangs/times out, but fallback works perfectly
+                    # Steps were pre-extracted by the tailer; the full-code parse
+                    # only runs for sessions that recorded nothing parseable
+                    print("📋 Extracting steps using fallback method (fast & reliable)")
+                    english_steps = session.get("steps") or self._extract_steps_from_code(playwright_code)
                 RecorderLogger.log_llm_conversion(len(playwright_code), len(english_steps))
             
             # Create test case structure
@@ -207,7 +344,7 @@ class RecorderAgent:
                 "output_file": output_file
             }
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
             # This shouldn't happen since we handle timeout above, but just in case
             process.kill()
             raise Exception("Failed to stop recording process (timeout)")
@@ -236,9 +373,10 @@ class RecorderAgent:
         started_at = datetime.fromisoformat(session["started_at"])
         duration = (datetime.now() - started_at).seconds
         
-        # Check if process is still running
+        # Check if process is still running — asyncio processes expose
+        # returncode (None while running) instead of poll()
         process = session.get("process")
-        if process and process.poll() is None:
+        if process and process.returncode is None:
             status = "recording"
         else:
             status = "stopped"
@@ -281,6 +419,18 @@ class RecorderAgent:
         
         return '\n'.join(code_lines)
     
+    async def _convert_many(self, codes: List[str]) -> List[List[str]]:
+        """
+        Convert several recordings' code to English steps concurrently.
+
+        One in-flight LLM request per recording via asyncio.gather, so a
+        batch of stops pays a single round trip of latency instead of N;
+        the content-addressed cache still short-circuits repeats.
+        """
+        return list(await asyncio.gather(
+            *(self._convert_code_to_english_steps(code) for code in codes)
+        ))
+
     async def _convert_code_to_english_steps(self, playwright_code: str) -> List[str]:
         """
         Convert Playwright code to human-readable English steps using LLM
@@ -291,37 +441,37 @@ class RecorderAgent:
         Returns:
             List of English step descriptions
         """
-        try:
-            # Get LLM instance
-            llm = get_llm()
-            
-            # Create prompt for conversion
-            prompt = f"""You are a QA test documentation expert. Convert the following Playwright test code into clear, human-readable test steps.
+        if not _USE_LLM_STEPS:
+            return self._extract_steps_from_code(playwright_code)
 
-Requirements:
-- Each step should start with an action verb (Navigate, Click, Enter, Verify, etc.)
-- Reference business intent, not technical selectors
-- Be concise but descriptive
-- Make it readable by non-technical users
-- Generate ONE step for EACH line of action code
+        # Identical code (modulo surrounding whitespace) converts identically —
+        # serve repeats from the in-process cache instead of re-paying the LLM
+        cache_key = hashlib.blake2b(
+            playwright_code.strip().encode(), digest_size=16
+        ).hexdigest()
+        cached = _STEP_CACHE.get(cache_key)
+        if cached is not None:
+            print(f"💾 Reusing cached step conversion ({len(cached)} steps)")
+            return list(cached)
 
-Playwright Code:
-```python
-{playwright_code}
-```
+        try:
+            # Deferred imports: the provider SDK graph only loads on the
+            # opt-in LLM path, never at module import
+            from browser_use.llm.messages import SystemMessage, UserMessage
+            from src.llm.llm_factory import get_llm
 
-Return ONLY a JSON array of step descriptions, like:
-["Navigate to the application", "Enter username in login field", "Click submit button"]
+            llm = get_llm()
 
-Do NOT include explanations or any text outside the JSON array.
-"""
-            
             RecorderLogger.log_llm_conversion(len(playwright_code), 0)
             print(f"📤 Sending {len(playwright_code)} bytes to LLM for conversion")
-            
-            # Call LLM
-            response = await llm.ainvoke(prompt)
-            content = response.content if hasattr(response, 'content') else str(response)
+
+            # Call LLM — instructions go in a cacheable system message so
+            # only the recording body is reprocessed (and re-billed) per call
+            response = await llm.ainvoke([
+                SystemMessage(content=_CONVERSION_INSTRUCTIONS, cache=True),
+                UserMessage(content=f"Playwright Code:\n```python\n{playwright_code}\n```"),
+            ])
+            content = response.completion if hasattr(response, 'completion') else str(response)
             
             print(f"📥 LLM Response ({len(content)} chars): {content[:300]}...")
             
@@ -359,6 +509,9 @@ Do NOT include explanations or any text outside the JSON array.
             
             if steps and len(steps) > 0:
                 RecorderLogger.log_llm_conversion(len(playwright_code), len(steps))
+                # Only successful LLM conversions are cached — the fallback
+                # path is cheap and deterministic already
+                _STEP_CACHE[cache_key] = list(steps)
                 return steps
             else:
                 print("⚠️ All extraction methods failed, using fallback")
@@ -383,88 +536,17 @@ Do NOT include explanations or any text outside the JSON array.
             List of basic step descriptions
         """
         print("📋 Extracting steps from code using fallback method")
-        steps = []
-        lines = code.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Skip empty lines, imports, function defs, context managers
-            if not line or line.startswith('import') or line.startswith('from'):
-                continue
-            if line.startswith('async def') or line.startswith('async with'):
-                continue
-            if 'await context.close()' in line or 'await browser.close()' in line:
-                continue
-            if line.startswith('#') or line.startswith('"""'):
-                continue
-            
-            # Extract actions
-            step = None
-            
-            # Navigation
-            if '.goto(' in line:
-                url_match = re.search(r'goto\(["\']([^"\' ]+)["\']\)', line)
-                if url_match:
-                    step = f'Navigate to "{url_match.group(1)}"'
-            
-            # Fill/Type (new syntax: locator().fill())
-            elif '.fill(' in line:
-                # Extract value being filled
-                value_match = re.search(r'fill\(["\']([^"\' ]+)["\']\)', line)
-                if value_match:
-                    value = value_match.group(1)
-                    # Try to identify the field from data-test attribute
-                    if 'data-test=' in line:
-                        field_match = re.search(r'data-test=["\\]*([^"\\]+)["\\]*', line)
-                        if field_match:
-                            field = field_match.group(1)
-                            step = f'Enter "{value}" in {field} field'
-                        else:
-                            step = f'Enter "{value}" in field'
-                    else:
-                        step = f'Enter "{value}" in field'
-            
-            # Click (new syntax: locator().click() or get_by_role().click())
-            elif '.click()' in line:
-                # get_by_role with name
-                if 'get_by_role' in line:
-                    role_match = re.search(r'get_by_role\(["\']([^"\' ]+)["\'], name=["\']([^"\' ]+)["\']\)', line)
-                    if role_match:
-                        role = role_match.group(1)
-                        name = role_match.group(2)
-                        step = f'Click "{name}" {role}'
-                
-                # locator with data-test
-                elif 'data-test=' in line:
-                    field_match = re.search(r'data-test=["\\]*([^"\\]+)["\\]*', line)
-                    if field_match:
-                        field = field_match.group(1)
-                        step = f'Click {field}'
-                    else:
-                        step = 'Click element'
-                
-                else:
-                    step = 'Click element'
-            
-            # Old syntax patterns (for compatibility)
-            elif 'page.click(' in line:
-                step = 'Click element'
-            elif 'page.fill(' in line:
-                step = 'Fill field'
-            elif 'page.type(' in line:
-                step = 'Type in field'
-            elif 'expect(' in line:
-                step = 'Verify element'
-            elif 'page.press(' in line:
-                step = 'Press key'
-            elif 'page.close()' in line:
-                step = 'Close page'
-            
-            if step:
-                steps.append(step)
+
+        # The scan itself lives in _step_extract, a self-contained typed
+        # module that an optional mypyc/Cython build step can compile
+        steps = extract_steps(code)
+
+        # Per-step echo only at DEBUG — a long recording is one stdout
+        # write per step otherwise
+        if recorder_logger.isEnabledFor(logging.DEBUG):
+            for step in steps:
                 print(f"   • {step}")
-        
+
         if not steps:
             print("   ⚠️ No steps extracted, using default")
             steps = ["Manual test steps - code recorded successfully"]
@@ -475,10 +557,10 @@ Do NOT include explanations or any text outside the JSON array.
     
     def _generate_test_id(self, suite_name: str) -> str:
         """Generate a unique test case ID"""
-        # Count existing tests in this suite
-        count = sum(1 for s in self.sessions.values() 
-                   if s.get("config", {}).get("suite_name") == suite_name)
-        return f"TC{str(count + 1).zfill(3)}"
+        # O(1) per-suite counter instead of scanning every session on record
+        n = self._suite_counts.get(suite_name, 0) + 1
+        self._suite_counts[suite_name] = n
+        return f"TC{n:03d}"
 
 
 # Global recorder instance
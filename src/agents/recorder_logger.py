@@ -36,57 +36,57 @@ class RecorderLogger:
     def log_session_start(session_id: str, config: dict):
         """Log the start of a recording session"""
         recorder_logger.info("=" * 80)
-        recorder_logger.info(f"🎬 RECORDING SESSION START: {session_id}")
-        recorder_logger.info(f"   Suite: {config.get('suite_name', 'N/A')}")
-        recorder_logger.info(f"   Test: {config.get('test_title', 'N/A')}")
-        recorder_logger.info(f"   URL: {config.get('url', 'N/A')}")
-        recorder_logger.info(f"   Headless: {config.get('headless', False)}")
+        recorder_logger.info("🎬 RECORDING SESSION START: %s", session_id)
+        recorder_logger.info("   Suite: %s", config.get('suite_name', 'N/A'))
+        recorder_logger.info("   Test: %s", config.get('test_title', 'N/A'))
+        recorder_logger.info("   URL: %s", config.get('url', 'N/A'))
+        recorder_logger.info("   Headless: %s", config.get('headless', False))
         recorder_logger.info("=" * 80)
     
     @staticmethod
     def log_session_stop(session_id: str, code_length: int, steps_count: int):
         """Log the stop of a recording session"""
         recorder_logger.info("=" * 80)
-        recorder_logger.info(f"🛑 RECORDING SESSION STOP: {session_id}")
-        recorder_logger.info(f"   Code Length: {code_length} bytes")
-        recorder_logger.info(f"   Steps Generated: {steps_count}")
+        recorder_logger.info("🛑 RECORDING SESSION STOP: %s", session_id)
+        recorder_logger.info("   Code Length: %s bytes", code_length)
+        recorder_logger.info("   Steps Generated: %s", steps_count)
         recorder_logger.info("=" * 80)
     
     @staticmethod
     def log_command(cmd: list):
         """Log the Playwright command being executed"""
-        recorder_logger.debug(f"📝 Playwright Command: {' '.join(cmd)}")
+        recorder_logger.debug("📝 Playwright Command: %s", ' '.join(cmd))
     
     @staticmethod
     def log_process_info(pid: int, status: str):
         """Log process information"""
-        recorder_logger.debug(f"⚙️  Process PID: {pid}, Status: {status}")
+        recorder_logger.debug("⚙️  Process PID: %s, Status: %s", pid, status)
     
     @staticmethod
     def log_file_operation(operation: str, filepath: str, success: bool = True):
         """Log file operations"""
         status = "✅" if success else "❌"
-        recorder_logger.debug(f"{status} {operation}: {filepath}")
+        recorder_logger.debug("%s %s: %s", status, operation, filepath)
     
     @staticmethod
     def log_llm_conversion(code_length: int, steps_generated: int):
         """Log LLM conversion results"""
-        recorder_logger.info(f"🤖 LLM Conversion: {code_length} bytes → {steps_generated} steps")
+        recorder_logger.info("🤖 LLM Conversion: %s bytes → %s steps", code_length, steps_generated)
     
     @staticmethod
     def log_error(context: str, error: Exception):
         """Log errors with context"""
-        recorder_logger.error(f"❌ ERROR in {context}: {type(error).__name__}: {str(error)}")
+        recorder_logger.error("❌ ERROR in %s: %s: %s", context, type(error).__name__, error)
     
     @staticmethod
     def log_warning(message: str):
         """Log warnings"""
-        recorder_logger.warning(f"⚠️  {message}")
+        recorder_logger.warning("⚠️  %s", message)
     
     @staticmethod
     def log_test_save(suite_name: str, test_id: str, test_title: str):
         """Log test case save operation"""
-        recorder_logger.info(f"💾 Saving Test Case:")
-        recorder_logger.info(f"   Suite: {suite_name}")
-        recorder_logger.info(f"   ID: {test_id}")
-        recorder_logger.info(f"   Title: {test_title}")
+        recorder_logger.info("💾 Saving Test Case:")
+        recorder_logger.info("   Suite: %s", suite_name)
+        recorder_logger.info("   ID: %s", test_id)
+        recorder_logger.info("   Title: %s", test_title)
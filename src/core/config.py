@@ -7,7 +7,15 @@ Call `Config.load()` explicitly at application startup.
 from __future__ import annotations
 
 import os
-from dotenv import load_dotenv
+from dotenv import find_dotenv, load_dotenv
+
+# Locate .env once at import — find_dotenv walks the filesystem, so repeat
+# load() calls shouldn't re-pay the directory scan
+_DOTENV_PATH = find_dotenv(usecwd=True)
+
+# API keys resolved once at load() — get_api_key sits on the per-request LLM
+# factory path and shouldn't rebuild the mapping from the environment each call
+_API_KEY_CACHE: dict[str, str | None] = {}
 
 
 class Config:
@@ -26,10 +34,20 @@ class Config:
     CUSTOM_API_KEY: str = "sk-dummy"
     CUSTOM_MODEL_NAME: str = "llama3"
 
+    _loaded: bool = False
+
     @classmethod
     def load(cls) -> None:
-        """Load environment variables from .env and populate class attributes."""
-        load_dotenv()
+        """Load environment variables from .env and populate class attributes.
+
+        Idempotent — the parse and attribute population run once per process;
+        reset ``Config._loaded`` to force a reload.
+        """
+        if cls._loaded:
+            return
+        cls._loaded = True
+
+        load_dotenv(_DOTENV_PATH)
 
         cls.PROVIDER = os.getenv("LLM_PROVIDER", "gemini").lower()
 
@@ -43,15 +61,21 @@ class Config:
         cls.CUSTOM_API_KEY = os.getenv("CUSTOM_API_KEY", "sk-dummy")
         cls.CUSTOM_MODEL_NAME = os.getenv("CUSTOM_MODEL_NAME", "llama3")
 
+        cls.invalidate_api_keys()
+
     @staticmethod
     def get_api_key(provider: str) -> str | None:
-        """Return the API key for the given provider."""
-        keys: dict[str, str | None] = {
+        """Return the API key for the given provider (cached at load())."""
+        return _API_KEY_CACHE.get(provider)
+
+    @staticmethod
+    def invalidate_api_keys() -> None:
+        """Re-read API keys from the environment (load() does this; tests too)."""
+        _API_KEY_CACHE.update({
             "gemini": os.getenv("GOOGLE_API_KEY"),
             "openai": os.getenv("OPENAI_API_KEY"),
             "anthropic": os.getenv("ANTHROPIC_API_KEY"),
-        }
-        return keys.get(provider)
+        })
 
 
 # Load config immediately on import so existing code that reads Config.PROVIDER etc.
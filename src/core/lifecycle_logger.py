@@ -2,12 +2,18 @@
 Lifecycle Event Logger for AI Testing Agent
 Tracks and stores all lifecycle events during exploration and execution.
 """
+from collections import defaultdict, deque
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from operator import attrgetter
+from itertools import islice
+from typing import Deque, List, Optional, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
-import json
+import atexit
+import heapq
 import os
+import queue
+import threading
 from pathlib import Path
 import uuid
 
@@ -38,6 +44,16 @@ class SecurityContext(BaseModel):
     zero_trust: bool = True
     isolation_level: str = "none"
 
+    class Config:
+        # Frozen so the shared default singleton below can't be mutated
+        # through one event and leak into every other
+        frozen = True
+
+
+# Most events never touch their security context — share one frozen default
+# instead of allocating a fresh model per event
+_DEFAULT_SECURITY_CONTEXT = SecurityContext()
+
 
 class LifecycleEvent(BaseModel):
     """Structured lifecycle event"""
@@ -50,21 +66,42 @@ class LifecycleEvent(BaseModel):
     action: str
     description: str = ""
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    security_context: SecurityContext = Field(default_factory=SecurityContext)
+    security_context: SecurityContext = Field(default_factory=lambda: _DEFAULT_SECURITY_CONTEXT)
     duration_ms: Optional[int] = None
     
     class Config:
+        # frozen: events are immutable once logged, letting pydantic reuse
+        # validators/serializers across instances
+        frozen = True
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
 
 
+# Shared validator for bulk reloads — validate_json parses each line inside
+# pydantic-core, with no Python-level json.loads intermediate
+_EVENT_ADAPTER = TypeAdapter(LifecycleEvent)
+
+
+# RAM holds only the hot tail of the event stream; the JSONL files remain
+# the source of truth for full history
+MAX_IN_MEMORY_EVENTS = int(os.getenv('LIFECYCLE_MAX_EVENTS', 10000))
+
+
 class LifecycleLogger:
     """Singleton logger for lifecycle events"""
     _instance = None
-    _events: List[LifecycleEvent] = []
+    _events: Deque[LifecycleEvent] = deque(maxlen=MAX_IN_MEMORY_EVENTS)
+    # event_id index mirroring _events — O(1) dedup when reloading files
+    _event_ids: set = set()
+    # per-session buckets in append (i.e. timestamp) order, so latest-N
+    # queries slice instead of sorting
+    _by_session: Dict[str, Deque[LifecycleEvent]] = defaultdict(deque)
     _current_session_id: str = "default"
     _persist_dir: Path = Path("data/lifecycle_logs")
+    # path -> mtime of files already ingested, so unchanged session files
+    # are never re-parsed
+    _file_mtimes: Dict[Path, float] = {}
     
     def __new__(cls):
         if cls._instance is None:
@@ -72,10 +109,26 @@ class LifecycleLogger:
             cls._instance._initialize()
         return cls._instance
     
+    # Writer batching: drain up to _BATCH_SIZE queued events per wake-up,
+    # waking at least every _BATCH_TIMEOUT seconds
+    _BATCH_SIZE = 64
+    _BATCH_TIMEOUT = 0.05
+
     def _initialize(self):
         """Initialize the logger"""
         # Create persistence directory
         self._persist_dir.mkdir(parents=True, exist_ok=True)
+
+        # One daemon thread drains events in batches with an open append
+        # handle per session, so the event-producing path never touches the
+        # filesystem and open/close is amortized over the batch
+        self._write_queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._drain_write_queue, name="lifecycle-writer", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self._flush_writer)
+
         print(f"[LifecycleLogger] Initialized - Logs dir: {self._persist_dir}")
     
     @classmethod
@@ -102,7 +155,10 @@ class LifecycleLogger:
         """Log a lifecycle event"""
         instance = cls()
         
-        event = LifecycleEvent(
+        # model_construct skips the validator pass — every caller hands in
+        # typed enums already, so the hot path pays only the allocation of
+        # the event itself (event_id/timestamp defaults still apply)
+        event = LifecycleEvent.model_construct(
             session_id=instance._current_session_id,
             event_type=event_type,
             phase=phase,
@@ -110,11 +166,11 @@ class LifecycleLogger:
             action=action,
             description=description,
             metadata=metadata or {},
-            security_context=security_context or SecurityContext(),
+            security_context=security_context or _DEFAULT_SECURITY_CONTEXT,
             duration_ms=duration_ms
         )
         
-        instance._events.append(event)
+        instance._remember(event)
         
         # Persist to file (async in production)
         instance._persist_event(event)
@@ -122,14 +178,67 @@ class LifecycleLogger:
         print(f"[LifecycleLogger] Event logged: {event_type} - {action}")
         return event
     
+    def _remember(self, event: LifecycleEvent):
+        """Track an event in memory, evicting the oldest when at capacity"""
+        events = self._events
+        if events.maxlen is not None and len(events) == events.maxlen:
+            oldest = events[0]
+            self._event_ids.discard(oldest.event_id)
+            bucket = self._by_session.get(oldest.session_id)
+            if bucket and bucket[0] is oldest:
+                bucket.popleft()
+        events.append(event)
+        self._event_ids.add(event.event_id)
+        self._by_session[event.session_id].append(event)
+
     def _persist_event(self, event: LifecycleEvent):
-        """Persist event to file"""
+        """Persist event to file (written in batches by the writer thread)"""
         try:
-            session_file = self._persist_dir / f"{event.session_id}.jsonl"
-            with open(session_file, 'a') as f:
-                f.write(event.json() + '\n')
+            # model_dump_json serializes in pydantic-core's Rust path — no
+            # per-field encoder lambdas or intermediate Python strings
+            self._write_queue.put((event.session_id, event.model_dump_json() + '\n'))
         except Exception as e:
             print(f"[LifecycleLogger] Failed to persist event: {e}")
+
+    def _drain_write_queue(self):
+        """Writer-thread loop: batch queued events into per-session handles"""
+        handles: Dict[str, Any] = {}
+        while True:
+            try:
+                batch = [self._write_queue.get(timeout=self._BATCH_TIMEOUT)]
+            except queue.Empty:
+                continue
+            while len(batch) < self._BATCH_SIZE:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            by_session: Dict[str, List[str]] = {}
+            for session_id, line in batch:
+                by_session.setdefault(session_id, []).append(line)
+
+            for session_id, lines in by_session.items():
+                try:
+                    fh = handles.get(session_id)
+                    if fh is None:
+                        fh = handles[session_id] = open(
+                            self._persist_dir / f"{session_id}.jsonl", 'a'
+                        )
+                    fh.writelines(lines)
+                    fh.flush()
+                except Exception as e:
+                    print(f"[LifecycleLogger] Failed to persist event: {e}")
+
+            for _ in batch:
+                self._write_queue.task_done()
+
+    def _flush_writer(self):
+        """Block until every queued event has been written (atexit hook)"""
+        try:
+            self._write_queue.join()
+        except Exception:
+            pass
     
     def _load_events_from_files(self):
         """Load events from persisted JSONL files"""
@@ -143,16 +252,23 @@ class LifecycleLogger:
             
             for jsonl_file in jsonl_files:
                 try:
+                    mtime = jsonl_file.stat().st_mtime
+                    if self._file_mtimes.get(jsonl_file) == mtime:
+                        continue
+
                     with open(jsonl_file, 'r') as f:
-                        for line in f:
+                        # Only the last maxlen lines can survive the ring
+                        # buffer anyway — skip parsing anything older
+                        for line in deque(f, maxlen=MAX_IN_MEMORY_EVENTS):
                             if line.strip():
-                                event_dict = json.loads(line)
-                                # Reconstruct LifecycleEvent from dict
-                                event = LifecycleEvent(**event_dict)
+                                # Reconstruct LifecycleEvent in one Rust-side
+                                # parse+validate pass
+                                event = _EVENT_ADAPTER.validate_json(line)
                                 # Only add if not already in memory
-                                if not any(e.event_id == event.event_id for e in self._events):
-                                    self._events.append(event)
+                                if event.event_id not in self._event_ids:
+                                    self._remember(event)
                                     loaded_count += 1
+                    self._file_mtimes[jsonl_file] = mtime
                 except Exception as e:
                     print(f"[LifecycleLogger] Failed to load {jsonl_file}: {e}")
             
@@ -171,17 +287,21 @@ class LifecycleLogger:
             instance._load_events_from_files()
         
         if session_id:
-            events = [e for e in instance._events if e.session_id == session_id]
-        else:
-            events = instance._events
-        
-        # Sort by timestamp descending (latest first)
-        events = sorted(events, key=lambda e: e.timestamp, reverse=True)
-        
+            # Buckets are in append (timestamp) order — latest-N is a slice
+            bucket = instance._by_session.get(session_id)
+            if not bucket:
+                return []
+            if limit:
+                tail = list(islice(bucket, max(0, len(bucket) - limit), len(bucket)))
+            else:
+                tail = list(bucket)
+            return tail[::-1]
+
+        # All sessions, latest first: a bounded heap beats a full sort when
+        # only the newest few are wanted
         if limit:
-            events = events[:limit]  # Take first N after sorting
-        
-        return events
+            return heapq.nlargest(limit, instance._events, key=attrgetter('timestamp'))
+        return sorted(instance._events, key=attrgetter('timestamp'), reverse=True)
     
     @classmethod
     def get_current_session(cls) -> str:
@@ -195,10 +315,19 @@ class LifecycleLogger:
         instance = cls()
         
         if session_id:
-            instance._events = [e for e in instance._events if e.session_id != session_id]
+            instance._events = deque(
+                (e for e in instance._events if e.session_id != session_id),
+                maxlen=MAX_IN_MEMORY_EVENTS,
+            )
+            instance._event_ids = {e.event_id for e in instance._events}
+            instance._by_session.pop(session_id, None)
+            instance._file_mtimes.pop(instance._persist_dir / f"{session_id}.jsonl", None)
             print(f"[LifecycleLogger] Cleared events for session: {session_id}")
         else:
-            instance._events = []
+            instance._events = deque(maxlen=MAX_IN_MEMORY_EVENTS)
+            instance._event_ids = set()
+            instance._by_session = defaultdict(deque)
+            instance._file_mtimes = {}
             print(f"[LifecycleLogger] Cleared all events")
     
     @classmethod
@@ -8,20 +8,82 @@ Usage:
 """
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 import sys
 import traceback
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 _LOG_DIR = Path("logs")
 _CRASH_DIR = _LOG_DIR / "crashes"
 
+# Optional fast JSON encoder for file records; stdlib fallback
+try:
+    import orjson
+
+    def _dumps(obj: dict) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj: dict) -> str:
+        return json.dumps(obj)
+
+
+class _JsonFormatter(logging.Formatter):
+    """
+    Emit one JSON object per record.
+
+    One C-level encode replaces the %-style substitutions, the raw float
+    record.created replaces a strftime per record, and the file becomes
+    machine-parseable.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        out = {
+            "ts": record.created,
+            "name": record.name,
+            "level": record.levelname,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            out["exc"] = self.formatException(record.exc_info)
+        return _dumps(out)
+
 # Track which loggers have already been configured to avoid duplicate handlers.
 _configured: set[str] = set()
 
+# Producers enqueue records and return; one listener thread owns the real
+# rotating file handler, so log calls never contend on the handler's I/O lock.
+_log_queue: queue.Queue | None = None
+_listener: QueueListener | None = None
+
+
+def _queue_handler() -> QueueHandler:
+    """Return a QueueHandler feeding the shared listener, starting it lazily."""
+    global _log_queue, _listener
+
+    if _log_queue is None:
+        _LOG_DIR.mkdir(parents=True, exist_ok=True)
+        file_handler = RotatingFileHandler(
+            _LOG_DIR / "app.log",
+            maxBytes=10 * 1024 * 1024,  # 10 MB
+            backupCount=5,
+        )
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(_JsonFormatter())
+
+        _log_queue = queue.Queue(-1)
+        _listener = QueueListener(_log_queue, file_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+
+    return QueueHandler(_log_queue)
+
 
 def setup_logger(name: str = "app") -> logging.Logger:
     """
@@ -47,16 +109,10 @@ def setup_logger(name: str = "app") -> logging.Logger:
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
 
-    # Rotating file handler — DEBUG and above
-    _LOG_DIR.mkdir(parents=True, exist_ok=True)
-    file_handler = RotatingFileHandler(
-        _LOG_DIR / "app.log",
-        maxBytes=10 * 1024 * 1024,  # 10 MB
-        backupCount=5,
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    # File logging goes through the shared queue — the rotating handler
+    # lives on the listener thread, producers only enqueue, and records
+    # land as JSON lines
+    logger.addHandler(_queue_handler())
 
     _configured.add(name)
     return logger
@@ -5,9 +5,11 @@ Credentials are injected locally into Playwright and NEVER sent to any LLM.
 """
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
+import time
 from pathlib import Path
 
 from browser_use.actor.page import Page
@@ -16,6 +18,15 @@ from browser_use.actor.page import Page
 class SecretsManager:
     """Handles secure, local-only injection of credentials into the browser."""
 
+    # Candidate selectors comma-joined into one CSS list each: a single CDP
+    # round-trip per field instead of one per candidate. The :has-text()
+    # button fallback stays separate — it's Playwright-only syntax and would
+    # invalidate a plain querySelectorAll list.
+    _USER_SEL = "input[name='user-name'], #user-name, input[type='email'], #username, #email"
+    _PASS_SEL = "input[name='password'], #password, input[type='password']"
+    _BTN_SEL = "input[type='submit'], #login-button, button[type='submit'], [data-test='login-button']"
+    _BTN_FALLBACK = "button:has-text('Login')"
+
     def __init__(
         self,
         username: str | None = None,
@@ -44,51 +55,31 @@ class SecretsManager:
             print("⚠️  No credentials provided. Skipping login injection.")
             return
 
-        import asyncio
-
         print(f"🔐 SECURE: Navigating to {self.login_url}…")
         await page.goto(self.login_url)
-        await asyncio.sleep(3)
+        await self._wait_for_login_form(page)
 
         print("🔐 SECURE: Injecting credentials via Python (AI excluded)…")
 
-        user_selectors = [
-            "input[name='user-name']",
-            "#user-name",
-            "input[type='email']",
-            "#username",
-            "#email",
-        ]
-        pass_selectors = [
-            "input[name='password']",
-            "#password",
-            "input[type='password']",
-        ]
-        btn_selectors = [
-            "input[type='submit']",
-            "#login-button",
-            "button:has-text('Login')",
-            "button[type='submit']",
-            "[data-test='login-button']",
-        ]
-
-        for selector in user_selectors:
-            elements = await page.get_elements_by_css_selector(selector)
-            if elements:
-                await elements[0].fill(self.username)
-                break
-
-        for selector in pass_selectors:
-            elements = await page.get_elements_by_css_selector(selector)
-            if elements:
-                await elements[0].fill(self.password)
-                break
-
-        for selector in btn_selectors:
-            elements = await page.get_elements_by_css_selector(selector)
-            if elements:
-                await elements[0].click()
-                break
+        # Both field lookups are independent RPCs — overlap them, and the
+        # fills too, so the form costs one round-trip of latency
+        user_elements, pass_elements = await asyncio.gather(
+            page.get_elements_by_css_selector(self._USER_SEL),
+            page.get_elements_by_css_selector(self._PASS_SEL),
+        )
+        fills = []
+        if user_elements:
+            fills.append(user_elements[0].fill(self.username))
+        if pass_elements:
+            fills.append(pass_elements[0].fill(self.password))
+        if fills:
+            await asyncio.gather(*fills)
+
+        elements = await page.get_elements_by_css_selector(self._BTN_SEL)
+        if not elements:
+            elements = await page.get_elements_by_css_selector(self._BTN_FALLBACK)
+        if elements:
+            await elements[0].click()
 
         await asyncio.sleep(3)
         await self._handle_post_login_alerts(page)
@@ -100,8 +91,6 @@ class SecretsManager:
 
         Returns True if a valid cached session was loaded, False otherwise.
         """
-        import asyncio
-
         if not self.cache_file or not self.cache_file.exists():
             return False
 
@@ -109,6 +98,22 @@ class SecretsManager:
             print(f"🚀 OPTIMISATION: Found cached session for {self.username}…")
             cookies = json.loads(self.cache_file.read_text())
             await page.context.add_cookies(cookies)
+
+            # Decide from cookie expiry when the cookies carry one — no
+            # point rendering a full page just to probe the cookie jar
+            now = time.time()
+            expiries = [c.get("expires") for c in cookies
+                        if c.get("expires") not in (None, -1)]
+            if expiries:
+                if min(expiries) <= now:
+                    print("   ❌ Cached session EXPIRED (cookie expiry) — removing cache")
+                    self.cache_file.unlink(missing_ok=True)
+                    return False
+                print("   ✅ Cached session VALID by cookie expiry — skipping probe navigation")
+                return True
+
+            # Session-scoped cookies carry no expiry — fall back to the
+            # rendered probe
             await page.goto(self.login_url)
             await asyncio.sleep(2)
 
@@ -137,10 +142,25 @@ class SecretsManager:
 
     # ── Private helpers ───────────────────────────────────────────────────────
 
+    async def _wait_for_login_form(self, page: Page, timeout: float = 3.0) -> None:
+        """
+        Poll until the login form is queryable instead of sleeping blind.
+
+        browser_use's goto has no wait_until, so this is the nearest
+        event-based wait: fast pages return in ~100ms rather than paying a
+        fixed 3s sleep.
+        """
+        deadline = asyncio.get_event_loop().time() + timeout
+        while asyncio.get_event_loop().time() < deadline:
+            try:
+                if await page.get_elements_by_css_selector(self._USER_SEL):
+                    return
+            except Exception:
+                pass  # page still navigating
+            await asyncio.sleep(0.1)
+
     async def _handle_post_login_alerts(self, page: Page) -> None:
         """Dismiss browser password-save / change-password popups via ESC."""
-        import asyncio
-
         print("🔐 SECURE: Checking for post-login alerts…")
         await asyncio.sleep(2)
 
@@ -163,8 +183,14 @@ class SecretsManager:
 
         try:
             cookies = await page.context.cookies()
-            self.cache_file.write_text(json.dumps(cookies))
-            os.chmod(self.cache_file, 0o600)
+            # Encode + write + chmod on a worker thread so the event loop
+            # keeps running while the disk I/O happens
+            await asyncio.to_thread(self._save_session_sync, cookies)
             print("💾 Session cookies cached — future runs will skip login")
         except Exception as exc:
             print(f"⚠️  Failed to save session cache: {exc}")
+
+    def _save_session_sync(self, cookies: list) -> None:
+        """Blocking half of _save_session, meant to run via to_thread."""
+        self.cache_file.write_text(json.dumps(cookies))
+        os.chmod(self.cache_file, 0o600)
@@ -11,6 +11,11 @@ import re
 from datetime import datetime
 from pathlib import Path
 
+# A bare id (or data-test attribute) selector matches at most one element,
+# so the .first sub-locator — an extra protocol hop per action — is dropped
+# for those targets.
+_UNIQUE_SELECTOR_RE = re.compile(r"^#[\w-]+$|^\[data-test=[^\]]+\]$")
+
 
 class PlaywrightGenerator:
     """Generates runnable Playwright Python scripts from AI test-case dicts."""
@@ -92,14 +97,29 @@ Generated : {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 """
 import asyncio
 import json
+import logging
 import os
-import re
+import time
 from pathlib import Path
 
-from playwright.async_api import async_playwright, expect
+from playwright.async_api import expect
+
+import _harness
+
+# Per-step chatter sits at DEBUG so CI runs (TC_LOG=WARNING) skip the
+# formatting and console I/O entirely
+log = logging.getLogger("tc")
+log.setLevel(os.getenv("TC_LOG", "INFO"))
+if not log.handlers:
+    log.addHandler(logging.StreamHandler())
 
+# Metadata is parsed once at import; repeated invocations reuse the dict.
+# Passwords never live in the file — they come from the environment below.
+_CONFIG_FILE = Path(__file__).with_name("{suite_name}_metadata.json")
+_CONFIG = json.loads(_CONFIG_FILE.read_text()) if _CONFIG_FILE.exists() else {{}}
 
-async def test_{test_id.lower().replace("-", "_")}():
+
+async def test_{test_id.lower().replace("-", "_")}(context):
     """
     {title}
 
@@ -111,92 +131,64 @@ async def test_{test_id.lower().replace("-", "_")}():
 
         script += '    """\n'
 
-        # ── Browser setup ─────────────────────────────────────────────────────
+        # ── Page setup ────────────────────────────────────────────────────────
+        # Browser launch and context creation live in _harness; the script only
+        # asks for a page in the context it was handed.
         script += f'''
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=False,
-            slow_mo=1000,
-            args=[
-                "--start-maximized",
-                "--disable-save-password-bubble",
-                "--disable-password-manager",
-                "--disable-infobars",
-                "--no-default-browser-check",
-            ],
-        )
-        context = await browser.new_context(no_viewport=True)
-        page = await context.new_page()
-
-        # ── Credentials ───────────────────────────────────────────────────────
-        # Prefer metadata file; fall back to environment variables.
-        config_file = Path(__file__).parent / "{suite_name}_metadata.json"
-        if config_file.exists():
-            config = json.loads(config_file.read_text())
-            test_url      = config.get("url", "")
-            test_username = config.get("username", "")
-        else:
-            test_url      = "{credentials.get('url', '')}"
-            test_username = "{credentials.get('username', '')}"
+    page = await context.new_page()
 
-        # Password is always loaded from the environment — never stored in files.
-        test_password = os.getenv("APP_PASSWORD", "")
+    # ── Credentials ───────────────────────────────────────────────────────────
+    # Metadata values win; generation-time values are the fallback.
+    test_url      = _CONFIG.get("url") or "{credentials.get('url', '')}"
+    test_username = _CONFIG.get("username") or "{credentials.get('username', '')}"
 
-        try:
-            print(f"Starting test: {title}")
-            test_id = "{test_id}"
+    # Password is always loaded from the environment — never stored in files.
+    test_password = os.getenv("APP_PASSWORD", "")
+
+    try:
+        log.info("Starting test: {title}")
+        test_id = "{test_id}"
 
 '''
 
         # ── Login ─────────────────────────────────────────────────────────────
         script += '''
-            # Login (only if credentials are present and login form is visible)
-            if test_username and test_password:
-                await page.goto(test_url)
-                await page.wait_for_load_state("networkidle")
-
-                login_selector = "#login-button, input[type=\\'submit\\'], button:has-text(\\'Login\\')"
-                login_count = await page.locator(login_selector).count()
-                login_visible = (
-                    await page.locator(login_selector).first.is_visible(timeout=2000)
-                    if login_count > 0
-                    else False
-                )
+        # Login — skipped entirely when the context was seeded from auth.json
+        if _harness.auth_state():
+            log.info("Step: Using cached login state from auth.json")
+            await page.goto(test_url.rstrip("/") + "/inventory.html", wait_until="domcontentloaded")
+        elif test_username and test_password:
+            await _harness.login(page, test_url, test_username, test_password)
+        else:
+            await page.goto(test_url, wait_until="domcontentloaded")
 
-                if login_visible:
-                    await page.locator(
-                        "input[name=\\'user-name\\'], #user-name, input[type=\\'text\\']"
-                    ).first.fill(test_username)
-                    await page.locator(
-                        "input[name=\\'password\\'], #password, input[type=\\'password\\']"
-                    ).first.fill(test_password)
-                    await page.locator(login_selector).first.click()
-                    await page.wait_for_load_state("networkidle")
-            else:
-                await page.goto(test_url)
-                await page.wait_for_load_state("networkidle")
-
-            # ── Test steps ────────────────────────────────────────────────────
+        # ── Test steps ────────────────────────────────────────────────────────
 '''
 
         # ── Per-step logic ────────────────────────────────────────────────────
         for i, step in enumerate(steps, 1):
             step_lower = step.lower()
 
-            # Extract explicit CSS selectors from step description
+            # Extract explicit CSS selectors from step description. A dot or
+            # comma only terminates the capture before whitespace/EOL —
+            # selectors themselves start with or contain dots
+            # (.shopping_cart_link), which the bare terminators swallowed
+            # into an empty capture
             selector_match = re.search(
-                r"(?:Selector|CSS selector)(?:s)?: (.*?)(?:$|\.|,|\))",
+                r"(?:Selector|CSS selector)(?:s)?: (.*?)(?:$|[.,](?=\s|$)|\))",
                 step,
                 re.IGNORECASE,
             )
             extracted_selectors: list[str] = []
             if selector_match:
                 raw = selector_match.group(1).split(",")
-                extracted_selectors = [s.strip().rstrip(")") for s in raw]
+                # drop empties so a failed capture falls back to the click
+                # heuristics / "body" verify instead of locator("")
+                extracted_selectors = [s for s in (p.strip().rstrip(")") for p in raw) if s]
 
             # Fill actions
             if any(kw in step_lower for kw in ("input", "fill", "enter")):
-                script += f'            print("Step {i}: {step}")\n'
+                script += f'        log.debug("Step {i}: {step}")\n'
 
                 field_map = {
                     "first name": ("Test", '#first-name, input[name="firstName"]'),
@@ -211,7 +203,8 @@ async def test_{test_id.lower().replace("-", "_")}():
                             default_sel,
                         )
                         sel_escaped = sel.replace('"', '\\"')
-                        script += f'            await page.locator("{sel_escaped}").first.fill("{value}")\n'
+                        first = "" if _UNIQUE_SELECTOR_RE.match(sel) else ".first"
+                        script += f'        await page.locator("{sel_escaped}"){first}.fill("{value}", timeout=5000)\n'
 
             # Click actions
             if any(kw in step_lower for kw in ("click", "add", "navigate")):
@@ -240,39 +233,83 @@ async def test_{test_id.lower().replace("-", "_")}():
                         )
                         click_selector = f'button:has-text("{btn_name}"), text={btn_name}'
 
+                # click() already auto-waits for visibility/actionability, so a
+                # separate is_visible probe would just double the round-trips
                 safe_sel = click_selector.replace('"', '\\"')
-                script += f'''            print("  → Clicking {safe_sel}")\n            btn = page.locator("{safe_sel}").first\n            if await btn.is_visible():\n                await btn.click()\n            else:\n                await page.click("{safe_sel}", timeout=2000)\n            await page.wait_for_load_state("networkidle")\n'''
+                first = "" if _UNIQUE_SELECTOR_RE.match(click_selector) else ".first"
+                script += f'        log.debug("  → Clicking {safe_sel}")\n'
+
+                # Clicks that load a new page arm the navigation listener
+                # before the click fires, so the click and the
+                # domcontentloaded wait overlap in a single round-trip.
+                # In-place clicks (add to cart, menu toggles) get no load
+                # wait at all — the next step's expect waits implicitly.
+                in_place = any(kw in step_lower for kw in ("add", "remove", "menu", "burger"))
+                navigates = not in_place and any(
+                    kw in step_lower
+                    for kw in ("cart", "checkout", "continue", "finish", "login", "logout", "navigate")
+                )
+                if navigates:
+                    script += (
+                        '        async with page.expect_navigation(wait_until="domcontentloaded", timeout=10000):\n'
+                        f'            await page.locator("{safe_sel}"){first}.click(timeout=5000)\n'
+                    )
+                else:
+                    script += f'        await page.locator("{safe_sel}"){first}.click(timeout=5000)\n'
 
-            # Verify actions
+            # Verify actions — assert on the step's own selector rather than the
+            # match-anything URL pattern, so the check can actually fail fast
             if any(kw in step_lower for kw in ("verify", "assert")):
-                script += f'            print("Step {i}: {step}")\n'
-                script += '            await expect(page).to_have_url(re.compile(".*"), timeout=5000)\n'
+                script += f'        log.debug("Step {i}: {step}")\n'
+                if extracted_selectors:
+                    verify_sel = extracted_selectors[0].replace('"', '\\"')
+                else:
+                    verify_sel = "body"
+                script += (
+                    f'        await expect(page.locator("{verify_sel}"))'
+                    ".to_be_visible(timeout=5000)\n"
+                )
 
-            # No recognised action — just wait
+            # No recognised action — log the step and move on
             if not any(
                 kw in step_lower
                 for kw in ("input", "fill", "enter", "click", "add", "navigate", "verify", "assert")
             ):
-                script += f'            print("Step {i}: {step}")\n'
-                script += "            await page.wait_for_timeout(1000)\n"
+                script += f'        log.debug("Step {i}: {step}")\n'
 
         # ── Teardown ──────────────────────────────────────────────────────────
+        test_fn = f"test_{test_id.lower().replace('-', '_')}"
         script += f'''
-            print("Test PASSED ✓")
-            return "PASS"
-
-        except Exception as exc:
-            print(f"Test FAILED ✗: {{exc}}")
-            await page.screenshot(path=f"failure_{{test_id}}.png")
-            return "FAIL"
-
-        finally:
-            await browser.close()
+        log.info("Test PASSED ✓")
+        return "PASS"
+
+    except Exception as exc:
+        log.error("Test FAILED ✗: %s", exc)
+        if os.getenv("TC_SCREENSHOTS", "1") == "1":
+            # Best-effort screenshot — must never mask the real failure
+            # (the page may be crashed/closed, which is often why we're
+            # here). JPEG at q60 encodes ~3x faster and ~10x smaller than
+            # PNG; the disk write happens off the event loop
+            try:
+                image = await page.screenshot(type="jpeg", quality=60)
+                await asyncio.to_thread(Path(f"failure_{{test_id}}.jpg").write_bytes, image)
+            except Exception as screenshot_error:
+                log.error("  (screenshot failed: %s)", screenshot_error)
+        return "FAIL"
+
+
+async def main():
+    try:
+        return await _harness.with_context({test_fn}, storage_state=_harness.auth_state())
+    finally:
+        await _harness.shutdown()
 
 
 if __name__ == "__main__":
-    result = asyncio.run(test_{test_id.lower().replace("-", "_")}())
-    print(f"Final Result: {{result}}")
+    _started = time.monotonic()
+    result = asyncio.run(main())
+    # single machine-readable result line for CI consumers
+    print(json.dumps({{"id": "{test_id}", "result": result, "duration_s": round(time.monotonic() - _started, 3)}}))
 '''
 
         return script